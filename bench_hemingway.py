@@ -0,0 +1,554 @@
+#!/opt/homebrew/bin/python3.12
+"""Benchmarks for the hemingway.py analyzer.
+
+Run directly:
+    python bench_hemingway.py                      # micro-benchmarks
+    python bench_hemingway.py --suite -o out.json  # throughput/latency/memory suite
+    python bench_hemingway.py --suite --compare baseline.json
+
+The suite measures analyze_text, analyze_text_fast, split_text,
+analyze_sentence, the reward functions and, when it can be loaded, the
+reward tokenizer on synthetic and real-ish corpora at several document
+sizes, and writes the results as JSON so runs from different versions can
+be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+from hemingway import (
+    adverbs_list,
+    analyze_batch,
+    analyze_sentence,
+    analyze_text,
+    analyze_text_fast,
+    calculate_reading_level,
+    calculate_reading_stats_batch,
+    get_readability_level,
+    get_analysis_pool,
+    passive_voices,
+    shutdown_analysis_pool,
+    split_text,
+    weak_phrases,
+)
+import hemingway_rewards
+from hemingway_rewards import RewardTable, tokenizer_token_counter
+from test_hemingway import COMPLEX_TEXT, COMPLEX_TEXT_2, SAMPLE_SETTINGS, SAMPLE_TEXT
+
+
+def legacy_analyze_sentence(sentence, settings):
+    """analyze_sentence as it was before the compiled qualifier index."""
+    words = re.findall(r'\b\w+\b', sentence.lower())
+    letters = sum(len(word) for word in words)
+    found_qualifiers = []
+    sentence_lower = sentence.lower()
+    for phrase in weak_phrases:
+        if re.search(r'\b' + re.escape(phrase) + r'\b', sentence_lower):
+            found_qualifiers.append(phrase)
+    for phrase in weak_phrases:
+        parts = phrase.split()
+        if len(parts) > 1:
+            pattern = r'\b' + r'\b\s+\w+\s+\b'.join(map(re.escape, parts)) + r'\b'
+            if re.search(pattern, sentence_lower) and phrase not in found_qualifiers:
+                found_qualifiers.append(phrase)
+    found_adverbs = [word for word in words if word in adverbs_list]
+    found_passives = [word for word in words if word in passive_voices]
+    return {
+        "characters": len(sentence),
+        "letters": letters,
+        "words": len(words),
+        "qualifiers": len(found_qualifiers),
+        "adverbs": len(found_adverbs),
+        "passive_voices": len(found_passives),
+    }
+
+
+def corpus_sentences():
+    sentences = []
+    for text in (COMPLEX_TEXT, COMPLEX_TEXT_2):
+        for paragraph in split_text(text, "paragraph"):
+            sentences.extend(split_text(paragraph, "sentence"))
+    return sentences
+
+
+def bench(label, func, sentences, repeat=5, number=20):
+    best = min(timeit.repeat(
+        lambda: [func(sentence, SAMPLE_SETTINGS) for sentence in sentences],
+        repeat=repeat,
+        number=number,
+    ))
+    per_sentence_us = best / (number * len(sentences)) * 1e6
+    print(f"{label:<32} {per_sentence_us:8.2f} us/sentence")
+    return per_sentence_us
+
+
+def bench_qualifier_matching():
+    """Compare the compiled qualifier index against the per-phrase regex scan."""
+    sentences = corpus_sentences()
+    for sentence in sentences:
+        legacy = legacy_analyze_sentence(sentence, SAMPLE_SETTINGS)
+        current = analyze_sentence(sentence, SAMPLE_SETTINGS)
+        assert legacy["qualifiers"] == current["highlights"]["qualifiers"], sentence
+    print(f"analyze_sentence over {len(sentences)} sentences")
+    legacy = bench("legacy regex scan", legacy_analyze_sentence, sentences)
+    current = bench("compiled qualifier index", analyze_sentence, sentences)
+    print(f"speedup: {legacy / current:.1f}x")
+
+
+def bench_batch(num_texts=256):
+    """Compare serial analysis with analyze_batch on the shared process pool."""
+    texts = [COMPLEX_TEXT, COMPLEX_TEXT_2] * (num_texts // 2)
+    workers = os.cpu_count() or 1
+    start = time.perf_counter()
+    serial = [analyze_text_fast(text, SAMPLE_SETTINGS) for text in texts]
+    serial_secs = time.perf_counter() - start
+
+    get_analysis_pool(workers)  # pool startup is paid once, outside the timed region
+    start = time.perf_counter()
+    batched = analyze_batch(texts, SAMPLE_SETTINGS, workers=workers)
+    batch_secs = time.perf_counter() - start
+    shutdown_analysis_pool()
+
+    assert batched == serial
+    print(f"analyze_batch over {num_texts} texts with {workers} workers")
+    print(f"{'serial':<32} {num_texts / serial_secs:8.0f} docs/s")
+    print(f"{'process pool':<32} {num_texts / batch_secs:8.0f} docs/s")
+
+
+def legacy_reward_functions(count_tokens):
+    """
+    The five reward functions as train_hemingway.py had them before this series.
+
+    Each function analyzes every completion with its own uncached analyze_text
+    call, paragraph_structure re-analyzes every paragraph to count its
+    sentences, and token_length encodes one text at a time.
+    """
+    settings = {"reading_level_target": "NORMAL"}
+
+    def readability(completions, **kwargs):
+        rewards = []
+        for text in [completion[0]["content"] for completion in completions]:
+            if not text:
+                rewards.append(0.0)
+                continue
+            stats = analyze_text(text, settings)["stats"]
+            reward = 0.0
+            if 6 <= stats["reading_level"] <= 10:
+                reward += 0.5
+            elif stats["reading_level"] > 12:
+                reward -= 0.3
+            if stats["readability"] == "very_hard":
+                reward -= 0.4
+            rewards.append(reward)
+        return rewards
+
+    def conciseness(completions, **kwargs):
+        rewards = []
+        for text in [completion[0]["content"] for completion in completions]:
+            if not text:
+                rewards.append(0.0)
+                continue
+            stats = analyze_text(text, settings)["stats"]
+            words_per_sentence = stats["words"] / max(1, stats["sentences"])
+            reward = 0.0
+            if 15 <= words_per_sentence <= 20:
+                reward += 0.3
+            elif 20 < words_per_sentence < 25:
+                reward -= 0.3
+            elif 25 < words_per_sentence:
+                reward -= 0.6
+            rewards.append(reward)
+        return rewards
+
+    def active_voice(completions, **kwargs):
+        rewards = []
+        for text in [completion[0]["content"] for completion in completions]:
+            if not text:
+                rewards.append(0.0)
+                continue
+            passive_count = analyze_text(text, settings)["stats"]["highlights"]["passive_voices"]
+            rewards.append(0.5 if passive_count == 0 else -passive_count * 0.1)
+        return rewards
+
+    def token_length(completions, **kwargs):
+        return [count_tokens([completion[0]["content"]])[0] / 500 if completion[0]["content"] else 0.0
+                for completion in completions]
+
+    def paragraph_structure(completions, **kwargs):
+        rewards = []
+        for text in [completion[0]["content"] for completion in completions]:
+            if not text:
+                rewards.append(0.0)
+                continue
+            paragraphs = analyze_text(text, settings)["paragraphs"]
+            reward = 0.0
+            if paragraphs:
+                first = analyze_text(paragraphs[0], settings)["stats"]["sentences"]
+                reward += {1: 0.1, 2: 0.3, 3: 0.5, 4: 0.3}.get(first, -0.25)
+                for para in paragraphs[1:]:
+                    sentences = analyze_text(para, settings)["stats"]["sentences"]
+                    if sentences < 3:
+                        reward -= 0.1
+                    elif sentences <= 5:
+                        reward += 0.3
+                    elif sentences <= 7:
+                        reward += 0.1
+                    else:
+                        reward -= 0.3
+            rewards.append(min(0.5, reward))
+        return rewards
+
+    return [readability, conciseness, active_voice, token_length, paragraph_structure]
+
+
+def bench_reward_step(group_sizes=(8, 64), num_words=750, repeat=5):
+    """Compare one reward step of the five separate functions with the fused RewardTable."""
+    legacy_funcs = legacy_reward_functions(word_count_tokens)
+    table = RewardTable(word_count_tokens)
+    fused_funcs = table.reward_funcs()
+    print(f"reward step over completions of {num_words} words")
+    for group_size in group_sizes:
+        completions = [[{"role": "assistant", "content": realish_document(num_words, seed)}] for seed in range(group_size)]
+        legacy_scores = [func(completions) for func in legacy_funcs]
+        assert [func(completions) for func in fused_funcs] == legacy_scores
+
+        def legacy_step():
+            for func in legacy_funcs:
+                func(completions)
+
+        def fused_step():
+            table.clear()
+            for func in fused_funcs:
+                func(completions)
+
+        legacy = min(timeit.repeat(legacy_step, repeat=repeat, number=1))
+        fused = min(timeit.repeat(fused_step, repeat=repeat, number=1))
+        print(f"{group_size:>4} completions  legacy {legacy * 1e3:8.2f} ms  fused {fused * 1e3:8.2f} ms"
+              f"  speedup {legacy / fused:.1f}x")
+
+
+def bench_token_counting(group_sizes=(8, 64, 512), num_tokens=1_000, tokenizer_name="Qwen/Qwen2.5-14B-Instruct"):
+    """Compare per-text encode, one batched tokenizer call, and the trainer's completion ids."""
+    try:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+    except Exception as error:  # transformers or the tokenizer files may be missing here
+        print(f"token counting skipped: {type(error).__name__}: {error}")
+        return
+    count_tokens = tokenizer_token_counter(tokenizer)
+    document = realish_document(num_tokens)
+    while len(tokenizer.encode(document)) < num_tokens:
+        document += "\n\n" + document
+    document = tokenizer.decode(tokenizer.encode(document)[:num_tokens])
+    print(f"token counting over completions of {num_tokens} tokens with {tokenizer_name}")
+    for group_size in group_sizes:
+        texts = [f"{index} {document}" for index in range(group_size)]
+        completion_ids = [tokenizer.encode(text) for text in texts]
+        per_text = min(timeit.repeat(lambda: [len(tokenizer.encode(text)) for text in texts], repeat=3, number=1))
+        batched = min(timeit.repeat(lambda: count_tokens(texts), repeat=3, number=1))
+        from_ids = min(timeit.repeat(lambda: [len(ids) for ids in completion_ids], repeat=3, number=1))
+        print(f"{group_size:>4} completions  encode each {per_text * 1e3:8.2f} ms"
+              f"  batched {batched * 1e3:8.2f} ms  completion ids {from_ids * 1e3:8.3f} ms")
+
+
+def bench_reading_stats(sizes=(1_000, 10_000, 100_000)):
+    """Compare the scalar reading-level functions with the vectorized batch path."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    print("reading level / readability / reading time")
+    for size in sizes:
+        words = rng.integers(1, 2000, size=size)
+        letters = words * rng.integers(3, 7, size=size)
+        sentences = rng.integers(1, 120, size=size)
+        rows = [
+            {"letters": int(l), "words": int(w), "sentences": int(s)}
+            for l, w, s in zip(letters, words, sentences)
+        ]
+
+        def scalar():
+            for row in rows:
+                level = calculate_reading_level(row)
+                get_readability_level(level, SAMPLE_SETTINGS, row["words"])
+                row["words"] / 250 * 60
+
+        number = max(1, 100_000 // size)
+        scalar_secs = min(timeit.repeat(scalar, repeat=3, number=number)) / number
+        vector_secs = min(timeit.repeat(
+            lambda: calculate_reading_stats_batch(letters, words, sentences, SAMPLE_SETTINGS),
+            repeat=3,
+            number=number,
+        )) / number
+        print(f"N={size:<8} scalar {scalar_secs * 1e3:9.2f} ms   numpy {vector_secs * 1e3:8.2f} ms"
+              f"   speedup {scalar_secs / vector_secs:6.1f}x")
+
+
+def bench_hard_sentences():
+    """Measure what per-sentence hard/very hard classification adds to analyze_text."""
+    import hemingway
+
+    texts = [COMPLEX_TEXT, COMPLEX_TEXT_2]
+
+    def run():
+        for text in texts:
+            analyze_text_fast(text, SAMPLE_SETTINGS)
+
+    # Both analyze_sentence and the fast path classify through sentence_difficulty
+    original = hemingway.sentence_difficulty
+    with_classification = without_classification = float("inf")
+    # Interleave the two variants so machine noise hits both equally
+    for _ in range(15):
+        with_classification = min(with_classification, timeit.timeit(run, number=20))
+        hemingway.sentence_difficulty = lambda letters, words, level_settings: 0
+        try:
+            without_classification = min(without_classification, timeit.timeit(run, number=20))
+        finally:
+            hemingway.sentence_difficulty = original
+    overhead = with_classification / without_classification - 1
+    print(f"hard sentence classification adds {overhead * 100:.1f}% to analyze_text")
+    return overhead
+
+
+# ---------------------------------------------------------------------------
+# Suite
+
+SUITE_SIZES = (100, 1_000, 10_000, 100_000)
+REWARD_FUNCTION_NAMES = (
+    "readability_reward_func",
+    "conciseness_reward_func",
+    "active_voice_reward_func",
+    "token_length_reward_func",
+    "paragraph_structure_reward_func",
+)
+
+
+def synthetic_document(num_words, seed=0):
+    """Random prose mixing plain words with lexicon hits, in paragraphs of 2-7 sentences."""
+    rng = random.Random(seed)
+    plain = ("the", "a", "dog", "ran", "home", "light", "sea", "old", "man", "boat",
+             "caught", "fish", "water", "cold", "night", "long", "walked", "slowly")
+    lexicon = list(adverbs_list) + list(passive_voices) + ["i think", "just", "utilize", "a number of"]
+    paragraphs = []
+    words = 0
+    while words < num_words:
+        sentences = []
+        for _ in range(rng.randint(2, 7)):
+            length = rng.randint(4, 28)
+            sentence = [rng.choice(lexicon) if rng.random() < 0.08 else rng.choice(plain) for _ in range(length)]
+            sentences.append(" ".join(sentence).capitalize() + rng.choice(".!?"))
+            words += length
+        paragraphs.append(" ".join(sentences))
+    return truncate_words("\n\n".join(paragraphs), num_words)
+
+
+def realish_document(num_words, seed=0):
+    """Paragraphs of the test fixtures, shuffled and repeated to the requested size."""
+    rng = random.Random(seed)
+    pool = [p for text in (SAMPLE_TEXT, COMPLEX_TEXT, COMPLEX_TEXT_2) for p in text.split("\n\n") if p.strip()]
+    paragraphs = []
+    words = 0
+    while words < num_words:
+        paragraph = rng.choice(pool)
+        paragraphs.append(paragraph)
+        words += len(paragraph.split())
+    return truncate_words("\n\n".join(paragraphs), num_words)
+
+
+def truncate_words(text, num_words):
+    """Cut text after num_words whitespace-separated words, keeping the separators."""
+    matches = list(re.finditer(r"\S+", text))
+    if len(matches) <= num_words:
+        return text
+    return text[:matches[num_words - 1].end()]
+
+
+def word_count_tokens(texts):
+    """Stand-in for the reward tokenizer, so reward timings do not depend on it being installed."""
+    return [len(text.split()) for text in texts]
+
+
+# The suite scores rewards through its own table; the real tokenizer is timed as its own target
+SUITE_REWARD_TABLE = RewardTable(word_count_tokens)
+
+
+def clear_reward_caches():
+    """Forget the cached reward table, as at the start of a step."""
+    SUITE_REWARD_TABLE.clear()
+
+
+def load_reward_functions():
+    """Return {name: reward function} for the suite's reward table, in REWARD_FUNCTION_NAMES order."""
+    return dict(zip(REWARD_FUNCTION_NAMES, SUITE_REWARD_TABLE.reward_funcs()))
+
+
+def load_reward_tokenizer():
+    """Return (count_tokens, None), or (None, reason) if the reward tokenizer cannot be loaded here."""
+    try:
+        hemingway_rewards.get_reward_tokenizer()
+    except Exception as error:  # transformers and the tokenizer are optional for benchmarking
+        return None, f"{type(error).__name__}: {error}"
+    return hemingway_rewards.count_tokens, None
+
+
+def measure(func, min_runs=5, max_runs=200, budget_secs=1.0):
+    """Time func repeatedly and return latency percentiles, throughput and peak memory."""
+    func()  # warm up
+    latencies = []
+    start = time.perf_counter()
+    while len(latencies) < min_runs or (len(latencies) < max_runs and time.perf_counter() - start < budget_secs):
+        begin = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - begin)
+    latencies.sort()
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    return {
+        "runs": len(latencies),
+        "docs_per_sec": len(latencies) / sum(latencies),
+        "p50_ms": percentile(0.50) * 1e3,
+        "p99_ms": percentile(0.99) * 1e3,
+        "peak_kib": peak / 1024,
+    }
+
+
+def suite_targets(document, reward_functions, count_tokens=None):
+    """Yield (target name, zero-argument callable) pairs for one document."""
+    yield "analyze_text", lambda: analyze_text(document, SAMPLE_SETTINGS)
+    yield "analyze_text_fast", lambda: analyze_text_fast(document, SAMPLE_SETTINGS)
+
+    def split_all():
+        for paragraph in split_text(document, "paragraph"):
+            split_text(paragraph, "sentence")
+    yield "split_text", split_all
+
+    sentences = [s for p in split_text(document, "paragraph") for s in split_text(p, "sentence")]
+
+    def analyze_all_sentences():
+        for sentence in sentences:
+            analyze_sentence(sentence, SAMPLE_SETTINGS)
+    yield "analyze_sentence", analyze_all_sentences
+
+    completions = [[{"role": "assistant", "content": document}]]
+    for name, func in reward_functions.items():
+        def cold_reward(func=func):
+            # Each call models a new step: nothing is cached yet
+            clear_reward_caches()
+            func(completions)
+        yield name, cold_reward
+
+    def reward_step():
+        clear_reward_caches()
+        for func in reward_functions.values():
+            func(completions)
+    yield "reward_step", reward_step
+
+    if count_tokens is not None:
+        yield "reward_tokenizer", lambda: count_tokens([document])
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes=SUITE_SIZES, budget_secs=1.0, targets=None):
+    """Run the benchmark suite and return a JSON-serializable report."""
+    reward_functions = load_reward_functions()
+    count_tokens, skipped_reason = load_reward_tokenizer()
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "reward_tokenizer_skipped": skipped_reason,
+        },
+        "results": [],
+    }
+    for corpus, make_document in (("synthetic", synthetic_document), ("realish", realish_document)):
+        for size in sizes:
+            document = make_document(size)
+            for target, func in suite_targets(document, reward_functions, count_tokens):
+                if targets and target not in targets:
+                    continue
+                result = {"target": target, "corpus": corpus, "words": size, **measure(func, budget_secs=budget_secs)}
+                report["results"].append(result)
+                print(f"{target:<32} {corpus:<9} {size:>7} words  {result['docs_per_sec']:10.1f} docs/s"
+                      f"  p50 {result['p50_ms']:9.3f} ms  p99 {result['p99_ms']:9.3f} ms"
+                      f"  peak {result['peak_kib']:9.1f} KiB", flush=True)
+    return report
+
+
+def compare_reports(baseline, current, threshold=0.10):
+    """Print p50 changes against a baseline report; return the regressed entries."""
+    key = lambda result: (result["target"], result["corpus"], result["words"])
+    previous = {key(result): result for result in baseline["results"]}
+    regressions = []
+    print(f"compared with {baseline['meta'].get('revision')} ({baseline['meta'].get('timestamp')})")
+    for result in current["results"]:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        change = result["p50_ms"] / before["p50_ms"] - 1
+        marker = "  REGRESSION" if change > threshold else ""
+        print(f"{result['target']:<32} {result['corpus']:<9} {result['words']:>7} words  p50 {change * 100:+7.1f}%{marker}")
+        if change > threshold:
+            regressions.append(result)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", action="store_true", help="run the throughput/latency/memory suite")
+    parser.add_argument("-o", "--output", help="write suite results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare suite results against")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SUITE_SIZES), help="document sizes in words")
+    parser.add_argument("--targets", nargs="+", help="only run these targets")
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds to spend per measurement")
+    args = parser.parse_args(argv)
+
+    if not args.suite:
+        bench_qualifier_matching()
+        bench_batch()
+        bench_reading_stats()
+        bench_hard_sentences()
+        bench_reward_step()
+        bench_token_counting()
+        return 0
+
+    report = run_suite(args.sizes, budget_secs=args.budget, targets=args.targets)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare_reports(baseline, report):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
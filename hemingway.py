@@ -1,7 +1,24 @@
 #!/opt/homebrew/bin/python3.12
+import atexit
+import hashlib
+import mmap
+import os
 import re
-from pydantic import BaseModel, Field
-from typing import Dict, List
+import sys
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+# Kept off the import path: pydantic (see __getattr__ below), the process pool
+# and the command-line modules are imported where they are first needed.
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from hemingway_models import Highlights, ParagraphStats, SentenceStats, TextAnalysis, TextStats
 
 # Constants from the original JS file
 adverbs_list = {
@@ -571,6 +588,39 @@ def split_text(text, delimiter_type):
     
     return results
 
+_DELIMITER_RES = {
+    delimiter_type: re.compile(get_delimiter(delimiter_type))
+    for delimiter_type in ("paragraph", "sentence", "word")
+}
+
+def split_text_with_offsets(text, delimiter_type):
+    """
+    Split text like split_text, but return (offset, substring) pairs.
+
+    offset is where the substring starts in text. A period appended by
+    split_text only ever extends the end of a substring, so every other
+    character of the substring is text[offset + i].
+    """
+    delimiter = _DELIMITER_RES[delimiter_type]
+    results = []
+    position = 0
+    
+    for match in delimiter.finditer(text):
+        substring = text[position:match.start()]
+        if substring and not delimiter.match(substring):
+            if not substring.rstrip().endswith((".", "!", "?")):
+                substring = substring.rstrip() + "."
+            results.append((position, substring))
+        position = match.end()
+    
+    substring = text[position:]
+    if substring and not delimiter.match(substring):
+        if not substring.rstrip().endswith((".", "!", "?")):
+            substring = substring.rstrip() + "."
+        results.append((position, substring))
+    
+    return results
+
 def calculate_reading_level(stats):
     """Calculate reading level based on letters, words, and sentences."""
     letters = stats["letters"]
@@ -580,29 +630,37 @@ def calculate_reading_level(stats):
     if words == 0 or sentences == 0:
         return 0
     
+    return _reading_level(letters, words, sentences)
+
+def _reading_level(letters, words, sentences):
+    """The Automated Readability Index, rounded and clamped at 0; words and sentences are nonzero."""
     return max(round(letters / words * 4.71 + words / sentences * 0.5 - 21.43), 0)
 
+READABILITY_LEVELS = {
+    "ACCESSIBLE": {
+        "too_few_word_count": 8,
+        "hard_readability_level": 8,
+        "very_hard_readability_level": 12
+    },
+    "NORMAL": {
+        "too_few_word_count": 14,
+        "hard_readability_level": 10,
+        "very_hard_readability_level": 14
+    },
+    "TECHNICAL": {
+        "too_few_word_count": 14,
+        "hard_readability_level": 14,
+        "very_hard_readability_level": 18
+    }
+}
+
+def get_level_settings(parser_settings):
+    """Return the readability thresholds for the settings' reading_level_target."""
+    return READABILITY_LEVELS.get(parser_settings.get("reading_level_target", "NORMAL"), READABILITY_LEVELS["NORMAL"])
+
 def get_readability_level(reading_level, parser_settings, word_count):
     """Determine readability level based on reading level and settings."""
-    levels = {
-        "ACCESSIBLE": {
-            "too_few_word_count": 8,
-            "hard_readability_level": 8,
-            "very_hard_readability_level": 12
-        },
-        "NORMAL": {
-            "too_few_word_count": 14,
-            "hard_readability_level": 10,
-            "very_hard_readability_level": 14
-        },
-        "TECHNICAL": {
-            "too_few_word_count": 14,
-            "hard_readability_level": 14,
-            "very_hard_readability_level": 18
-        }
-    }
-    
-    level_settings = levels.get(parser_settings.get("reading_level_target", "NORMAL"), levels["NORMAL"])
+    level_settings = get_level_settings(parser_settings)
     
     if word_count < level_settings["too_few_word_count"]:
         return "normal"
@@ -612,40 +670,524 @@ def get_readability_level(reading_level, parser_settings, word_count):
         return "very_hard"
     return "normal"
 
-def analyze_sentence(sentence, settings):
-    """Analyze a sentence for various metrics."""
-    words = re.findall(r'\b\w+\b', sentence.lower())
+READABILITY_NAMES = ("normal", "hard", "very_hard")
+
+def sentence_difficulty(letters, words, level_settings):
+    """Return the READABILITY_NAMES index for one sentence's letter and word counts."""
+    if words < level_settings["too_few_word_count"]:
+        return 0
+    reading_level = _reading_level(letters, words, 1)
+    if reading_level >= level_settings["very_hard_readability_level"]:
+        return 2
+    if reading_level >= level_settings["hard_readability_level"]:
+        return 1
+    return 0
+
+def calculate_reading_stats_batch(letters, words, sentences, parser_settings):
+    """
+    Vectorized calculate_reading_level, get_readability_level and reading time.
+
+    Args:
+        letters, words, sentences: Array-likes of per-document counts, length N
+        parser_settings: Dictionary of parser settings including reading_level_target
+
+    Returns:
+        (reading_level, readability, reading_time_in_secs): NumPy arrays of
+        int64, str and float64 with the same rounding (half to even, like
+        round()) and clamping as the scalar functions.
+    """
+    import numpy as np
+
+    letters = np.asarray(letters, dtype=np.float64)
+    words = np.asarray(words, dtype=np.float64)
+    sentences = np.asarray(sentences, dtype=np.float64)
+
+    valid = (words != 0) & (sentences != 0)
+    safe_words = np.where(valid, words, 1.0)
+    safe_sentences = np.where(valid, sentences, 1.0)
+    raw_level = letters / safe_words * 4.71 + safe_words / safe_sentences * 0.5 - 21.43
+    reading_level = np.where(valid, np.maximum(np.rint(raw_level), 0), 0).astype(np.int64)
+
+    level_settings = get_level_settings(parser_settings)
+    codes = np.where(reading_level >= level_settings["hard_readability_level"], 1, 0)
+    codes = np.where(reading_level >= level_settings["very_hard_readability_level"], 2, codes)
+    codes = np.where(words < level_settings["too_few_word_count"], 0, codes)
+    readability = np.array(READABILITY_NAMES)[codes]
+
+    reading_time_in_secs = words / 250 * 60
+    return reading_level, readability, reading_time_in_secs
+
+# Words are matched as maximal \w+ runs, exactly like re.findall(r'\b\w+\b').
+# Splitting with a capture group yields [sep, word, sep, word, ..., sep] in a
+# single C-level pass, so the text between two words is available for free.
+_WORD_SPLIT_RE = re.compile(r"(\w+)")
+
+# Separator placeholder meaning "one or more whitespace characters" (regex \s+).
+_WHITESPACE = None
+# Token placeholder meaning "any single word" (regex \w+ between \s+).
+_ANY_WORD = None
+
+def _compile_phrase(phrase, allow_gap):
+    """Compile a lexicon phrase into (tokens, separators) for token-level matching.
+
+    The exact form matches the phrase verbatim between word boundaries. The gap
+    form matches exactly one extra word, surrounded by whitespace, between
+    every pair of space-separated parts of the phrase.
+    """
+    tokens = []
+    separators = []
+    for part_index, part in enumerate(phrase.split()):
+        if part_index:
+            if allow_gap:
+                tokens.append(_ANY_WORD)
+                separators.extend((_WHITESPACE, _WHITESPACE))
+            else:
+                separators.append(" ")
+        pieces = _WORD_SPLIT_RE.split(part)
+        tokens.extend(pieces[1::2])
+        separators.extend(pieces[2:-1:2])
+    return tuple(tokens), tuple(separators)
+
+def compile_phrase_index(phrases, allow_gap=False):
+    """Build a first-word index of compiled phrase patterns.
+
+    Returns a dict mapping a phrase's first word to (single, following,
+    gapped): the entries of one-token patterns, and dicts from the next
+    real token (the second token, or the third after a gap) to the entries
+    of longer patterns. An entry is (order, phrase, tokens, separators).
+    With allow_gap, multi-word phrases also get a pattern tolerating one
+    extra word between their parts.
+    """
+    index = {}
+    order = 0
+    for phrase in phrases:
+        forms = [_compile_phrase(phrase, allow_gap=False)]
+        if allow_gap and len(phrase.split()) > 1:
+            forms.append(_compile_phrase(phrase, allow_gap=True))
+        for tokens, separators in forms:
+            single, following, gapped = index.setdefault(tokens[0], ([], {}, {}))
+            entry = (order, phrase, tokens, separators)
+            order += 1
+            if len(tokens) == 1:
+                single.append(entry)
+            elif tokens[1] is _ANY_WORD:
+                gapped.setdefault(tokens[2], []).append(entry)
+            else:
+                following.setdefault(tokens[1], []).append(entry)
+    return {
+        word: (
+            tuple(single),
+            {token: tuple(entries) for token, entries in following.items()},
+            {token: tuple(entries) for token, entries in gapped.items()},
+        )
+        for word, (single, following, gapped) in index.items()
+    }
+
+def _match_phrase_at(words, separators, start, tokens, expected):
+    """Check whether a compiled phrase matches the word stream at `start`.
+
+    `separators[j]` is the text between words[j - 1] and words[j].
+    """
+    if start + len(tokens) > len(words):
+        return False
+    for offset in range(1, len(tokens)):
+        position = start + offset
+        token = tokens[offset]
+        if token is not _ANY_WORD and words[position] != token:
+            return False
+        separator = separators[position]
+        wanted = expected[offset - 1]
+        if wanted is _WHITESPACE:
+            if not separator.isspace():
+                return False
+        elif separator != wanted:
+            return False
+    return True
+
+def find_phrases(words, separators, index, starts=None):
+    """Return (start, end, phrase) for the distinct phrases of a compiled index.
+
+    Walks the words once; only words that start some phrase are checked
+    against that phrase's patterns. Each phrase is reported once, at its
+    first match; start and end are word indexes. starts, if given, lists
+    the ascending word indexes worth checking (see WORD_QUALIFIER_START).
+    """
+    found = []
+    seen = set()
+    count = len(words)
+    for start in range(count) if starts is None else starts:
+        node = index.get(words[start])
+        if node is None:
+            continue
+        entries, following, gapped = node
+        # Only patterns whose next real token is present can match here
+        if following and start + 1 < count:
+            more = following.get(words[start + 1])
+            if more:
+                entries = sorted(entries + more) if entries else more
+        if gapped and start + 2 < count:
+            more = gapped.get(words[start + 2])
+            if more:
+                entries = sorted(entries + more) if entries else more
+        for _, phrase, tokens, expected in entries:
+            if phrase not in seen and _match_phrase_at(words, separators, start, tokens, expected):
+                seen.add(phrase)
+                found.append((start, start + len(tokens), phrase))
+    return found
+
+_PHRASE_END = ""  # trie key marking a complete phrase; never a \w+ token
+
+def compile_phrase_trie(phrases):
+    """
+    Build a token-level trie over lexicon phrases.
+
+    Each node is a dict from the next word to the child node; a node that
+    completes a phrase also maps _PHRASE_END to the (whitespace-stripped)
+    phrase.
+    """
+    root = {}
+    for phrase in phrases:
+        node = root
+        for word in _WORD_SPLIT_RE.split(phrase.lower())[1::2]:
+            node = node.setdefault(word, {})
+        node[_PHRASE_END] = phrase.strip()
+    return root
+
+def find_phrase_occurrences(words, separators, trie, starts=None):
+    """
+    Return (start, end, phrase) for every trie phrase in a word stream.
+
+    Words of a phrase must be separated by whitespace only. Matches are
+    leftmost-longest and do not overlap, so each word is consumed at most
+    once; the cost is linear in the number of words times the longest
+    phrase length. starts, if given, lists the ascending word indexes worth
+    checking (see WORD_COMPLEX_START).
+    """
+    occurrences = []
+    count = len(words)
+    matched_end = 0
+    for start in range(count) if starts is None else starts:
+        if start < matched_end:
+            continue
+        node = trie.get(words[start])
+        if node is None:
+            continue
+        match_end = None
+        match_phrase = None
+        position = start + 1
+        while True:
+            phrase = node.get(_PHRASE_END)
+            if phrase is not None:
+                match_end = position
+                match_phrase = phrase
+            if position >= count or not separators[position].isspace():
+                break
+            node = node.get(words[position])
+            if node is None:
+                break
+            position += 1
+        if match_phrase is not None:
+            occurrences.append((start, match_end, match_phrase))
+            matched_end = match_end
+    return occurrences
+
+# Suggested replacements keyed by normalized phrase
+WORDY_SUGGESTIONS = {phrase.strip(): replacements for phrase, replacements in too_wordy.items()}
+
+# One table classifies every word for all lexicons at once: each word maps to
+# a bitmask of the classes below, so a token costs a single dict lookup
+# however many lexicons are active. Phrase lexicons mark their first words;
+# only those positions are handed to the phrase matchers.
+WORD_ADVERB = 1
+WORD_PASSIVE_VOICE = 2
+WORD_QUALIFIER_START = 4
+WORD_COMPLEX_START = 8
+
+LEXICON_KINDS = ("adverbs", "passive_voices", "qualifiers", "complex_words")
+
+@dataclass(slots=True, frozen=True)
+class Lexicons:
+    """Compiled lexicons: the word class table plus the phrase matchers it points into."""
+    word_classes: Dict[str, int]
+    qualifier_index: dict
+    wordy_trie: dict
+
+def compile_lexicons(adverbs=(), passive_voices=(), qualifiers=(), complex_words=()) -> Lexicons:
+    """Compile word and phrase lexicons into one Lexicons table."""
+    qualifier_index = compile_phrase_index(qualifiers, allow_gap=True)
+    wordy_trie = compile_phrase_trie(complex_words)
+    word_classes = {}
+    for words, word_class in (
+        (adverbs, WORD_ADVERB),
+        (passive_voices, WORD_PASSIVE_VOICE),
+        (qualifier_index, WORD_QUALIFIER_START),
+        (wordy_trie, WORD_COMPLEX_START),
+    ):
+        for word in words:
+            word = sys.intern(word)
+            word_classes[word] = word_classes.get(word, 0) | word_class
+    return Lexicons(word_classes, qualifier_index, wordy_trie)
+
+# Built once at import and inherited by forked pool workers
+DEFAULT_LEXICONS = compile_lexicons(adverbs_list, passive_voices, weak_phrases, too_wordy)
+
+def load_lexicon(path: str) -> List[str]:
+    """Read a lexicon file: one word or phrase per line; blank lines and # comments are skipped."""
+    with open(path, encoding="utf-8") as f:
+        entries = (line.strip().lower() for line in f)
+        return [entry for entry in entries if entry and not entry.startswith("#")]
+
+_custom_lexicons = {}
+
+def get_lexicons(parser_settings) -> Lexicons:
+    """
+    Return the compiled lexicons for parser_settings.
+
+    parser_settings["lexicons"] may map any of LEXICON_KINDS to a lexicon
+    file path (or a list of paths) whose entries extend the built-in lexicon
+    of that kind. Each combination is compiled once per process.
+    """
+    extra = parser_settings.get("lexicons")
+    if not extra:
+        return DEFAULT_LEXICONS
+    key = tuple(sorted(
+        (kind, (paths,) if isinstance(paths, str) else tuple(paths)) for kind, paths in extra.items()
+    ))
+    lexicons = _custom_lexicons.get(key)
+    if lexicons is None:
+        entries = {
+            "adverbs": list(adverbs_list),
+            "passive_voices": list(passive_voices),
+            "qualifiers": list(weak_phrases),
+            "complex_words": list(too_wordy),
+        }
+        for kind, paths in key:
+            if kind not in entries:
+                raise ValueError(f"unknown lexicon kind {kind!r}, expected one of {', '.join(LEXICON_KINDS)}")
+            for path in paths:
+                entries[kind].extend(load_lexicon(path))
+        lexicons = _custom_lexicons[key] = compile_lexicons(**entries)
+    return lexicons
+
+def merge_phrase_counts(total, counts):
+    """Add per-phrase counts into total, in place."""
+    for phrase, count in counts.items():
+        total[phrase] = total.get(phrase, 0) + count
+    return total
+
+def _add_highlights(total, highlights):
+    """Add one highlights dict into another, in place."""
+    for key, value in highlights.items():
+        if key == "complex_word_counts":
+            merge_phrase_counts(total[key], value)
+        else:
+            total[key] += value
+
+STATS_COUNT_KEYS = ("characters", "letters", "words", "sentences", "paragraphs")
+
+def accumulate_stats(total, stats):
+    """
+    Add sentence, paragraph or text counts into total, in place.
+
+    Keys missing from stats (a paragraph has no "paragraphs" count) add
+    nothing; derived metrics such as reading_level are never stored here and
+    are computed from the final totals by _text_stats.
+    """
+    for key in STATS_COUNT_KEYS:
+        total[key] += stats.get(key, 0)
+    _add_highlights(total["highlights"], stats["highlights"])
+    return total
+
+def combine_stats(left, right):
+    """
+    Return the counts of left followed by right as a new stats dict.
+
+    combine_stats is associative and _empty_stats() is its identity, so
+    counts for adjacent pieces of a text can be merged in any grouping.
+    """
+    return accumulate_stats(accumulate_stats(_empty_stats(), left), right)
+
+def classify_sentence(letters, words, settings):
+    """Return "normal", "hard" or "very_hard" for one sentence's letter and word counts."""
+    return READABILITY_NAMES[sentence_difficulty(letters, words, get_level_settings(settings))]
+
+# Highlight kinds recorded in span arrays, see analyze_text_fast(include_spans=True)
+SPAN_ADVERB = 0
+SPAN_QUALIFIER = 1
+SPAN_PASSIVE_VOICE = 2
+SPAN_COMPLEX_WORD = 3
+SPAN_HARD_SENTENCE = 4
+SPAN_VERY_HARD_SENTENCE = 5
+SPAN_KINDS = ("adverb", "qualifier", "passive_voice", "complex_word", "hard_sentence", "very_hard_sentence")
+
+# Opt-in per-stage profiling. The analysis functions read the module-level
+# _profiler once per call and skip all timing while it is None, so disabled
+# profiling costs one global lookup per call and one local check per stage.
+PROFILE_STAGES = ("split", "tokenize", "lexicon_match", "aggregate", "result_build")
+
+class StageProfiler:
+    """
+    Cumulative time and call counts per analysis stage, plus item counters.
+
+    Stages are PROFILE_STAGES; counters record documents, sentences and
+    words analyzed. Only analysis run in this process is recorded, not work
+    done on the process pool.
+    """
+
+    def __init__(self):
+        self.calls = dict.fromkeys(PROFILE_STAGES, 0)
+        self.seconds = dict.fromkeys(PROFILE_STAGES, 0.0)
+        self.counters = {"documents": 0, "sentences": 0, "words": 0}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.calls[stage] += 1
+            self.seconds[stage] += seconds
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            for stage in PROFILE_STAGES:
+                self.calls[stage] = 0
+                self.seconds[stage] = 0.0
+            for counter in self.counters:
+                self.counters[counter] = 0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Flat {"<stage>.seconds": s, "<stage>.calls": n, "<counter>": n} for step logs."""
+        with self._lock:
+            result = {}
+            for stage in PROFILE_STAGES:
+                result[f"{stage}.seconds"] = self.seconds[stage]
+                result[f"{stage}.calls"] = self.calls[stage]
+            result.update(self.counters)
+            return result
+
+_profiler = None
+
+def enable_profiling(profiler: Optional[StageProfiler] = None) -> StageProfiler:
+    """Start recording stage timings into profiler (a new one by default) and return it."""
+    global _profiler
+    _profiler = profiler if profiler is not None else StageProfiler()
+    return _profiler
+
+def disable_profiling() -> None:
+    global _profiler
+    _profiler = None
+
+@contextmanager
+def profile_stages():
+    """
+    Record stage timings for the analysis run inside the with block.
+
+    Example:
+        with profile_stages() as profiler:
+            analyze_text(text, settings)
+        log(profiler.as_dict())
+    """
+    global _profiler
+    previous = _profiler
+    profiler = enable_profiling()
+    try:
+        yield profiler
+    finally:
+        _profiler = previous
+
+def _word_offsets(sentence, sentence_lower, pieces, offset):
+    """Return (start, end) text offsets of each word found in sentence_lower."""
+    if len(sentence_lower) == len(sentence):
+        to_text = None
+    else:
+        # Lowercasing grew some characters (e.g. U+0130); map back per character
+        to_text = []
+        for index, char in enumerate(sentence):
+            to_text.extend([index] * len(char.lower()))
+    spans = []
+    position = 0
+    for index in range(1, len(pieces), 2):
+        position += len(pieces[index - 1])
+        end = position + len(pieces[index])
+        if to_text is None:
+            spans.append((offset + position, offset + end))
+        else:
+            spans.append((offset + to_text[position], offset + to_text[end - 1] + 1))
+        position = end
+    return spans
+
+def analyze_sentence(sentence, settings, spans=None, offset=0):
+    """
+    Analyze a sentence for various metrics.
+
+    If spans is an array, (start, end, kind) triples locating each highlight
+    are appended to it; offset is where the sentence starts in the text.
+    """
+    profiler = _profiler
+    if profiler is not None:
+        mark = time.perf_counter()
+    lexicons = get_lexicons(settings)
+    sentence_lower = sentence.lower()
+    pieces = _WORD_SPLIT_RE.split(sentence_lower)
+    words = pieces[1::2]
+    separators = pieces[0:-1:2]
     letters = sum(len(word) for word in words)
+    if profiler is not None:
+        now = time.perf_counter()
+        profiler.add("tokenize", now - mark)
+        mark = now
     
-    # Check for weak phrases - using word boundaries for proper matching
-    found_qualifiers = []
-    sentence_lower = sentence.lower()
+    # Classify every word once against all lexicons
+    adverbs = 0
+    passives = 0
+    qualifier_starts = []
+    complex_starts = []
+    word_classes = lexicons.word_classes
+    for index, word in enumerate(words):
+        word_class = word_classes.get(word)
+        if word_class:
+            if word_class & WORD_ADVERB:
+                adverbs += 1
+            if word_class & WORD_PASSIVE_VOICE:
+                passives += 1
+            if word_class & WORD_QUALIFIER_START:
+                qualifier_starts.append(index)
+            if word_class & WORD_COMPLEX_START:
+                complex_starts.append(index)
     
-    # First try exact matches
-    for phrase in weak_phrases:
-        if re.search(r'\b' + re.escape(phrase) + r'\b', sentence_lower):
-            found_qualifiers.append(phrase)
+    # Check for weak phrases, including variations with one additional word
+    # in between. For example: "I suggest" should match "I would suggest"
+    found_qualifiers = find_phrases(words, separators, lexicons.qualifier_index, qualifier_starts) if qualifier_starts else []
     
-    # Then try variations with additional words in between
-    # For example: "I would suggest" should match "I would strongly suggest"
-    for phrase in weak_phrases:
-        parts = phrase.split()
-        if len(parts) > 1:
-            pattern = r'\b' + r'\b\s+\w+\s+\b'.join(map(re.escape, parts)) + r'\b'
-            if re.search(pattern, sentence_lower) and phrase not in found_qualifiers:
-                found_qualifiers.append(phrase)
+    # Check for wordy phrases that have simpler replacements
+    found_complex = find_phrase_occurrences(words, separators, lexicons.wordy_trie, complex_starts) if complex_starts else []
+    complex_word_counts = {}
+    for _, _, phrase in found_complex:
+        complex_word_counts[phrase] = complex_word_counts.get(phrase, 0) + 1
     
-    # Check for adverbs
-    found_adverbs = []
-    for word in words:
-        if word in adverbs_list:
-            found_adverbs.append(word)
+    # Hard sentences use the same thresholds as the whole-text readability
+    readability = classify_sentence(letters, len(words), settings)
     
-    # Check for passive voice
-    found_passives = []
-    for word in words:
-        if word in passive_voices:
-            found_passives.append(word)
+    if spans is not None:
+        word_spans = _word_offsets(sentence, sentence_lower, pieces, offset)
+        for index, word in enumerate(words):
+            word_class = word_classes.get(word, 0)
+            if word_class & WORD_ADVERB:
+                spans.extend((*word_spans[index], SPAN_ADVERB))
+            if word_class & WORD_PASSIVE_VOICE:
+                spans.extend((*word_spans[index], SPAN_PASSIVE_VOICE))
+        for start, end, _ in found_qualifiers:
+            spans.extend((word_spans[start][0], word_spans[end - 1][1], SPAN_QUALIFIER))
+        for start, end, _ in found_complex:
+            spans.extend((word_spans[start][0], word_spans[end - 1][1], SPAN_COMPLEX_WORD))
+        if readability != "normal":
+            kind = SPAN_HARD_SENTENCE if readability == "hard" else SPAN_VERY_HARD_SENTENCE
+            # The sentence span stops before any period split_text appended
+            spans.extend((offset, offset + len(sentence.rstrip(".!?")), kind))
+    if profiler is not None:
+        profiler.add("lexicon_match", time.perf_counter() - mark)
     
     stats = {
         "characters": len(sentence),
@@ -653,21 +1195,33 @@ def analyze_sentence(sentence, settings):
         "words": len(words),
         "sentences": 1,  # Add this back for test compatibility
         "highlights": {
-            "adverbs": len(found_adverbs),
-            "complex_words": 0,  # Would need implementation
+            "adverbs": adverbs,
+            "complex_words": sum(complex_word_counts.values()),
             "grammar_issues": 0,  # Would need implementation
-            "hard_sentences": 0,
-            "passive_voices": len(found_passives),
+            "hard_sentences": int(readability == "hard"),
+            "passive_voices": passives,
             "qualifiers": len(found_qualifiers),
-            "very_hard_sentences": 0
+            "very_hard_sentences": int(readability == "very_hard"),
+            "complex_word_counts": complex_word_counts
         }
     }
     
     return stats
 
-def analyze_paragraph(paragraph, settings):
-    """Analyze a paragraph by analyzing its sentences."""
-    sentences = split_text(paragraph, "sentence")
+def analyze_paragraph(paragraph, settings, include_sentences=False, spans=None, offset=0):
+    """
+    Analyze a paragraph by analyzing its sentences.
+
+    With include_sentences, the per-sentence stats are kept under the
+    "sentence_stats" key so callers can inspect them without re-splitting.
+    spans and offset are passed on to analyze_sentence.
+    """
+    profiler = _profiler
+    if profiler is not None:
+        mark = time.perf_counter()
+    sentences = split_text_with_offsets(paragraph, "sentence")
+    if profiler is not None:
+        profiler.add("split", time.perf_counter() - mark)
     
     stats = {
         "characters": 0,
@@ -681,126 +1235,1368 @@ def analyze_paragraph(paragraph, settings):
             "hard_sentences": 0,
             "passive_voices": 0,
             "qualifiers": 0,
-            "very_hard_sentences": 0
+            "very_hard_sentences": 0,
+            "complex_word_counts": {}
         }
     }
     
-    for sentence in sentences:
-        sentence_stats = analyze_sentence(sentence, settings)
+    sentence_stats_list = []
+    for sentence_offset, sentence in sentences:
+        sentence_stats = analyze_sentence(sentence, settings, spans, offset + sentence_offset)
+        if profiler is not None:
+            mark = time.perf_counter()
         for key in stats:
             if key == "highlights":
-                for highlight_key in stats["highlights"]:
-                    stats["highlights"][highlight_key] += sentence_stats["highlights"][highlight_key]
+                _add_highlights(stats["highlights"], sentence_stats["highlights"])
             elif key != "sentences":  # Don't add sentence counts from individual sentences
                 stats[key] += sentence_stats.get(key, 0)
+        if include_sentences:
+            sentence_stats_list.append(sentence_stats)
+        if profiler is not None:
+            profiler.add("aggregate", time.perf_counter() - mark)
+    
+    if include_sentences:
+        stats["sentence_stats"] = sentence_stats_list
     
     return stats
 
-class Highlights(BaseModel):
-    adverbs: int = Field(description="Count of adverbs found in the text")
-    complex_words: int = Field(description="Count of complex words")
-    grammar_issues: int = Field(description="Count of grammar issues detected")
-    hard_sentences: int = Field(description="Count of sentences marked as hard to read")
-    passive_voices: int = Field(description="Count of passive voice constructions")
-    qualifiers: int = Field(description="Count of qualifying/weak phrases")
-    very_hard_sentences: int = Field(description="Count of sentences marked as very hard to read")
-
-    model_config = {
-        "populate_by_name": True
-    }
+# The pydantic models live in hemingway_models and are imported on first use
+# (PEP 562), so importing hemingway, e.g. in a fresh worker process, does not
+# pay for pydantic.
+MODEL_NAMES = ("Highlights", "TextStats", "SentenceStats", "ParagraphStats", "TextAnalysis")
 
-class TextStats(BaseModel):
-    characters: int = Field(description="Total number of characters")
-    letters: int = Field(description="Total number of letters")
-    words: int = Field(description="Total number of words")
-    sentences: int = Field(description="Total number of sentences")
-    paragraphs: int = Field(description="Total number of paragraphs")
-    highlights: Highlights = Field(description="Analysis highlights of writing issues")
-    reading_level: int = Field(description="Calculated reading level score")
-    readability: str = Field(description="Readability assessment (normal, hard, or very_hard)")
-    reading_time_in_secs: float = Field(description="Estimated reading time in seconds")
-
-    model_config = {
-        "populate_by_name": True
-    }
+def __getattr__(name):
+    if name in MODEL_NAMES:
+        import hemingway_models
+        return getattr(hemingway_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class TextAnalysis(BaseModel):
-    stats: TextStats = Field(description="Overall statistics of the analyzed text")
-    paragraphs: List[str] = Field(description="List of paragraphs in the text")
-    text: str = Field(description="The original input text")
+@dataclass(slots=True)
+class FastHighlights:
+    """Slotted counterpart of Highlights used on the hot path."""
+    adverbs: int = 0
+    complex_words: int = 0
+    grammar_issues: int = 0
+    hard_sentences: int = 0
+    passive_voices: int = 0
+    qualifiers: int = 0
+    very_hard_sentences: int = 0
+    complex_word_counts: Dict[str, int] = field(default_factory=dict)
 
-    model_config = {
-        "populate_by_name": True
-    }
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    @property
+    def complex_word_suggestions(self) -> Dict[str, List[str]]:
+        """Suggested replacements for each wordy phrase found."""
+        return {phrase: WORDY_SUGGESTIONS.get(phrase, []) for phrase in self.complex_word_counts}
+
+    def to_model(self) -> "Highlights":
+        from hemingway_models import Highlights
+        return Highlights(
+            adverbs=self.adverbs,
+            complex_words=self.complex_words,
+            grammar_issues=self.grammar_issues,
+            hard_sentences=self.hard_sentences,
+            passive_voices=self.passive_voices,
+            qualifiers=self.qualifiers,
+            very_hard_sentences=self.very_hard_sentences,
+            complex_word_counts=dict(self.complex_word_counts),
+            complex_word_suggestions=self.complex_word_suggestions
+        )
+
+@dataclass(slots=True)
+class FastSentenceStats:
+    """Slotted counterpart of SentenceStats."""
+    characters: int
+    letters: int
+    words: int
+    highlights: FastHighlights
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def to_model(self) -> "SentenceStats":
+        from hemingway_models import SentenceStats
+        return SentenceStats(
+            characters=self.characters,
+            letters=self.letters,
+            words=self.words,
+            highlights=self.highlights.to_model()
+        )
+
+@dataclass(slots=True)
+class FastParagraphStats:
+    """Slotted counterpart of ParagraphStats."""
+    characters: int
+    letters: int
+    words: int
+    sentences: int
+    highlights: FastHighlights
+    sentence_stats: List[FastSentenceStats]
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def to_model(self) -> "ParagraphStats":
+        from hemingway_models import ParagraphStats
+        return ParagraphStats(
+            characters=self.characters,
+            letters=self.letters,
+            words=self.words,
+            sentences=self.sentences,
+            highlights=self.highlights.to_model(),
+            sentence_stats=[sentence.to_model() for sentence in self.sentence_stats]
+        )
+
+@dataclass(slots=True)
+class FastTextStats:
+    """Slotted counterpart of TextStats."""
+    characters: int
+    letters: int
+    words: int
+    sentences: int
+    paragraphs: int
+    highlights: FastHighlights
+    reading_level: int
+    readability: str
+    reading_time_in_secs: float
 
     def __getitem__(self, key):
-        return self.model_dump()[key]
+        return getattr(self, key)
+
+    def to_model(self) -> "TextStats":
+        from hemingway_models import TextStats
+        return TextStats(
+            characters=self.characters,
+            letters=self.letters,
+            words=self.words,
+            sentences=self.sentences,
+            paragraphs=self.paragraphs,
+            highlights=self.highlights.to_model(),
+            reading_level=self.reading_level,
+            readability=self.readability,
+            reading_time_in_secs=self.reading_time_in_secs
+        )
+
+@dataclass(slots=True)
+class FastTextAnalysis:
+    """
+    Lightweight analysis result returned by analyze_text_fast.
+
+    Unlike TextAnalysis it keeps neither the input text nor the paragraph
+    strings, and field access (attribute or item) is a plain slot lookup.
+    Use to_model() to get the pydantic TextAnalysis for API or serialization.
+
+    spans, when requested, is a flat array('I') of (start, end, kind)
+    triples: offsets into the analyzed text and an index into SPAN_KINDS.
+    """
+    stats: FastTextStats
+    paragraph_stats: Optional[List[FastParagraphStats]] = None
+    spans: Optional[array] = None
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def iter_spans(self):
+        """Yield (start, end, kind name) for each recorded highlight span."""
+        spans = self.spans if self.spans is not None else ()
+        for index in range(0, len(spans), 3):
+            yield spans[index], spans[index + 1], SPAN_KINDS[spans[index + 2]]
+
+    def to_model(self, text: str, paragraphs: Optional[List[str]] = None) -> "TextAnalysis":
+        """Build the pydantic TextAnalysis for the text this result was computed from."""
+        from hemingway_models import TextAnalysis
+        if paragraphs is None:
+            paragraphs = split_text(text, "paragraph")
+        return TextAnalysis(
+            stats=self.stats.to_model(),
+            paragraphs=paragraphs,
+            text=text,
+            paragraph_stats=[
+                paragraph.to_model() for paragraph in self.paragraph_stats
+            ] if self.paragraph_stats is not None else None
+        )
+
+def _text_stats(overall_stats, parser_settings):
+    """Add the derived metrics to summed counts and build FastTextStats."""
+    reading_level = calculate_reading_level(overall_stats)
+    return FastTextStats(
+        characters=overall_stats["characters"],
+        letters=overall_stats["letters"],
+        words=overall_stats["words"],
+        sentences=overall_stats["sentences"],
+        paragraphs=overall_stats["paragraphs"],
+        highlights=FastHighlights(**overall_stats["highlights"]),
+        reading_level=reading_level,
+        readability=get_readability_level(
+            reading_level,
+            parser_settings,
+            overall_stats["words"]
+        ),
+        reading_time_in_secs=overall_stats["words"] / 250 * 60
+    )
+
+def _paragraph_tree(stats):
+    return FastParagraphStats(
+        characters=stats["characters"],
+        letters=stats["letters"],
+        words=stats["words"],
+        sentences=stats["sentences"],
+        highlights=FastHighlights(**stats["highlights"]),
+        sentence_stats=[
+            FastSentenceStats(
+                characters=sentence["characters"],
+                letters=sentence["letters"],
+                words=sentence["words"],
+                highlights=FastHighlights(**sentence["highlights"])
+            ) for sentence in stats["sentence_stats"]
+        ]
+    )
+
+def _analyze_paragraphs(paragraph_offsets, parser_settings, include_tree, spans=None, offset=0):
+    """Return (totals, paragraph tree or None) for (offset, paragraph) pairs."""
+    totals = _empty_stats()
+    tree = [] if include_tree else None
+    for paragraph_offset, paragraph in paragraph_offsets:
+        stats = analyze_paragraph(paragraph, parser_settings, include_tree, spans, offset + paragraph_offset)
+        accumulate_stats(totals, stats)
+        totals["paragraphs"] += 1
+        if include_tree:
+            tree.append(_paragraph_tree(stats))
+    return totals, tree
+
+def tokenize_document(text: str) -> List[tuple]:
+    """
+    Find paragraph and sentence boundaries in one walk over the text.
+
+    Returns a (start, end, sentences) triple per paragraph of
+    split_text(text, "paragraph"), where sentences lists the (start, end)
+    offsets of each sentence split_text would produce from that paragraph,
+    without the trailing whitespace and the period split_text appends. No
+    .!? character ever falls inside a sentence range, so the analyzed
+    sentence is always text[start:end] + ".".
+    """
+    paragraph_re = _DELIMITER_RES["paragraph"]
+    sentence_finditer = _DELIMITER_RES["sentence"].finditer
+    paragraphs = []
+    position = 0
+    breaks = [(match.start(), match.end()) for match in paragraph_re.finditer(text)]
+    breaks.append((len(text), len(text)))
+    for break_start, break_end in breaks:
+        paragraph_start, paragraph_end = position, break_start
+        position = break_end
+        if paragraph_start == paragraph_end:
+            continue
+        sentences = []
+        piece_start = paragraph_start
+        for match in sentence_finditer(text, paragraph_start, paragraph_end):
+            piece_end = match.start()
+            if piece_end > piece_start:
+                while piece_end > piece_start and text[piece_end - 1].isspace():
+                    piece_end -= 1
+                sentences.append((piece_start, piece_end))
+            piece_start = match.end()
+        if piece_start < paragraph_end:
+            piece_end = paragraph_end
+            while piece_end > piece_start and text[piece_end - 1].isspace():
+                piece_end -= 1
+            # A blank paragraph becomes "." in split_text, which has no sentences
+            if piece_end > piece_start or piece_start > paragraph_start:
+                sentences.append((piece_start, piece_end))
+        paragraphs.append((paragraph_start, paragraph_end, sentences))
+    return paragraphs
+
+def _paragraph_text(text, start, end):
+    """The paragraph string split_text returns for text[start:end]."""
+    paragraph = text[start:end]
+    if not paragraph.rstrip().endswith((".", "!", "?")):
+        paragraph = paragraph.rstrip() + "."
+    return paragraph
+
+def _sum_highlights(highlights_list):
+    total = FastHighlights()
+    for highlights in highlights_list:
+        total.adverbs += highlights.adverbs
+        total.complex_words += highlights.complex_words
+        total.hard_sentences += highlights.hard_sentences
+        total.passive_voices += highlights.passive_voices
+        total.qualifiers += highlights.qualifiers
+        total.very_hard_sentences += highlights.very_hard_sentences
+        merge_phrase_counts(total.complex_word_counts, highlights.complex_word_counts)
+    return total
+
+def _analyze_document(text, parser_settings, include_tree):
+    """
+    Analyze text from tokenize_document offsets, lowercasing it only once.
+
+    Returns (totals, paragraph tree or None, paragraph ranges), or None when
+    lowercasing the whole text is not the same as lowercasing each sentence:
+    when it changes the length (e.g. U+0130) or the text contains a capital
+    sigma, whose lowercase form depends on the following characters.
+    """
+    profiler = _profiler
+    clock = time.perf_counter
+    if profiler is not None:
+        mark = clock()
+    lower = text.lower()
+    if len(lower) != len(text) or "\u03a3" in text:
+        return None
+    lexicons = get_lexicons(parser_settings)
+    qualifier_index = lexicons.qualifier_index
+    wordy_trie = lexicons.wordy_trie
+    level_settings = get_level_settings(parser_settings)
+    too_few_words = level_settings["too_few_word_count"]
+    get_class = lexicons.word_classes.get
+    split = _WORD_SPLIT_RE.split
+
+    totals = _empty_stats()
+    characters = letters = words_total = sentences_total = 0
+    adverbs = passives = qualifiers = complex_words = hard = very_hard = 0
+    complex_word_counts = totals["highlights"]["complex_word_counts"]
+    tree = [] if include_tree else None
+    if profiler is not None:
+        now = clock()
+        profiler.add("tokenize", now - mark)
+        mark = now
+    paragraphs = tokenize_document(text)
+    if profiler is not None:
+        profiler.add("split", clock() - mark)
+
+    for _, _, sentences in paragraphs:
+        sentence_tree = [] if include_tree else None
+        for start, end in sentences:
+            if profiler is not None:
+                mark = clock()
+            pieces = split(lower[start:end])
+            words = pieces[1::2]
+            count = len(words)
+            sentence_letters = sum(map(len, words))
+            if profiler is not None:
+                now = clock()
+                profiler.add("tokenize", now - mark)
+                mark = now
+            sentence_adverbs = sentence_passives = 0
+            qualifier_starts = complex_starts = None
+            for index, word_class in enumerate(map(get_class, words)):
+                if word_class:
+                    if word_class & WORD_ADVERB:
+                        sentence_adverbs += 1
+                    if word_class & WORD_PASSIVE_VOICE:
+                        sentence_passives += 1
+                    if word_class & WORD_QUALIFIER_START:
+                        if qualifier_starts is None:
+                            qualifier_starts = []
+                        qualifier_starts.append(index)
+                    if word_class & WORD_COMPLEX_START:
+                        if complex_starts is None:
+                            complex_starts = []
+                        complex_starts.append(index)
+
+            sentence_qualifiers = 0
+            sentence_complex = {}
+            if qualifier_starts or complex_starts:
+                separators = pieces[0:-1:2]
+                if qualifier_starts:
+                    sentence_qualifiers = len(find_phrases(words, separators, qualifier_index, qualifier_starts))
+                if complex_starts:
+                    for _, _, phrase in find_phrase_occurrences(words, separators, wordy_trie, complex_starts):
+                        sentence_complex[phrase] = sentence_complex.get(phrase, 0) + 1
+            if profiler is not None:
+                now = clock()
+                profiler.add("lexicon_match", now - mark)
+                mark = now
+
+            # Short sentences are never hard; skip the call for them
+            sentence_hard = sentence_very_hard = 0
+            if count >= too_few_words:
+                difficulty = sentence_difficulty(sentence_letters, count, level_settings)
+                if difficulty == 2:
+                    sentence_very_hard = 1
+                elif difficulty == 1:
+                    sentence_hard = 1
 
-def analyze_text(text: str, parser_settings: Dict[str, str]) -> TextAnalysis:
+            sentence_complex_words = sum(sentence_complex.values()) if sentence_complex else 0
+            characters += end - start + 1
+            letters += sentence_letters
+            words_total += count
+            adverbs += sentence_adverbs
+            passives += sentence_passives
+            qualifiers += sentence_qualifiers
+            complex_words += sentence_complex_words
+            hard += sentence_hard
+            very_hard += sentence_very_hard
+            if sentence_complex:
+                merge_phrase_counts(complex_word_counts, sentence_complex)
+            if include_tree:
+                sentence_tree.append(FastSentenceStats(
+                    characters=end - start + 1,
+                    letters=sentence_letters,
+                    words=count,
+                    highlights=FastHighlights(
+                        adverbs=sentence_adverbs,
+                        complex_words=sentence_complex_words,
+                        hard_sentences=sentence_hard,
+                        passive_voices=sentence_passives,
+                        qualifiers=sentence_qualifiers,
+                        very_hard_sentences=sentence_very_hard,
+                        complex_word_counts=sentence_complex
+                    )
+                ))
+            if profiler is not None:
+                profiler.add("aggregate", clock() - mark)
+        sentences_total += len(sentences)
+        if include_tree:
+            if profiler is not None:
+                mark = clock()
+            tree.append(FastParagraphStats(
+                characters=sum(sentence.characters for sentence in sentence_tree),
+                letters=sum(sentence.letters for sentence in sentence_tree),
+                words=sum(sentence.words for sentence in sentence_tree),
+                sentences=len(sentences),
+                highlights=_sum_highlights(sentence.highlights for sentence in sentence_tree),
+                sentence_stats=sentence_tree
+            ))
+            if profiler is not None:
+                profiler.add("aggregate", clock() - mark)
+
+    totals.update(
+        characters=characters, letters=letters, words=words_total,
+        sentences=sentences_total, paragraphs=len(paragraphs)
+    )
+    totals["highlights"].update(
+        adverbs=adverbs, complex_words=complex_words, hard_sentences=hard,
+        passive_voices=passives, qualifiers=qualifiers, very_hard_sentences=very_hard
+    )
+    return totals, tree, paragraphs
+
+def _split_paragraphs(text):
+    profiler = _profiler
+    if profiler is None:
+        return split_text_with_offsets(text, "paragraph")
+    mark = time.perf_counter()
+    paragraph_offsets = split_text_with_offsets(text, "paragraph")
+    profiler.add("split", time.perf_counter() - mark)
+    return paragraph_offsets
+
+def _analyze_totals(text, parser_settings, include_tree, spans=None, offset=0):
+    """Return (totals, paragraph tree or None) for text, taking the single-pass path when possible."""
+    if spans is None:
+        analyzed = _analyze_document(text, parser_settings, include_tree)
+        if analyzed is not None:
+            return analyzed[0], analyzed[1]
+    paragraph_offsets = _split_paragraphs(text)
+    return _analyze_paragraphs(paragraph_offsets, parser_settings, include_tree, spans, offset)
+
+def _analyze(text, parser_settings, include_tree, include_spans=False, with_paragraphs=False):
+    """Run the analysis and return (FastTextAnalysis, paragraphs or None)."""
+    analyzed = None if include_spans else _analyze_document(text, parser_settings, include_tree)
+    if analyzed is not None:
+        totals, tree, paragraph_ranges = analyzed
+        spans = None
+    else:
+        paragraph_offsets = _split_paragraphs(text)
+        spans = array("I") if include_spans else None
+        totals, tree = _analyze_paragraphs(paragraph_offsets, parser_settings, include_tree, spans)
+
+    profiler = _profiler
+    if profiler is not None:
+        mark = time.perf_counter()
+    result = FastTextAnalysis(
+        stats=_text_stats(totals, parser_settings),
+        paragraph_stats=tree,
+        spans=spans
+    )
+    if not with_paragraphs:
+        paragraphs = None
+    elif analyzed is not None:
+        paragraphs = [_paragraph_text(text, start, end) for start, end, _ in paragraph_ranges]
+    else:
+        paragraphs = [paragraph for _, paragraph in paragraph_offsets]
+    if profiler is not None:
+        profiler.add("result_build", time.perf_counter() - mark)
+        profiler.count("documents")
+        profiler.count("sentences", totals["sentences"])
+        profiler.count("words", totals["words"])
+    return result, paragraphs
+
+def analyze_text_fast(
+    text: str,
+    parser_settings: Dict[str, str],
+    include_tree: bool = False,
+    include_spans: bool = False,
+) -> FastTextAnalysis:
+    """
+    Analyze text like analyze_text, but return the slotted FastTextAnalysis.
+
+    This is the hot path for reward scoring: no pydantic models are built and
+    the text is not retained. Call .to_model(text) to get a TextAnalysis.
+    With include_spans, the result also locates every adverb, qualifier,
+    passive voice, complex word and hard sentence as offsets into text; the
+    span array grows with the number of highlights, not with the text.
+    """
+    result, _ = _analyze(text, parser_settings, include_tree, include_spans)
+    return result
+
+def analyze_text_outline(text: str, parser_settings: Dict[str, str]) -> tuple:
+    """
+    Return (FastTextStats, sentence count of each paragraph) for text.
+
+    Cheaper than include_tree when only paragraph lengths are needed: the
+    counts come straight from the tokenizer's paragraph ranges.
+    """
+    analyzed = _analyze_document(text, parser_settings, False)
+    if analyzed is None:
+        totals, tree = _analyze_paragraphs(_split_paragraphs(text), parser_settings, True)
+        counts = [paragraph.sentences for paragraph in tree]
+    else:
+        totals, _, paragraphs = analyzed
+        counts = [len(sentences) for _, _, sentences in paragraphs]
+    profiler = _profiler
+    if profiler is not None:
+        profiler.count("documents")
+        profiler.count("sentences", totals["sentences"])
+        profiler.count("words", totals["words"])
+    return _text_stats(totals, parser_settings), counts
+
+def analyze_text(text: str, parser_settings: Dict[str, str], include_tree: bool = False) -> "TextAnalysis":
     """
     Analyze text for readability and writing style metrics.
     
     Args:
         text: The text to analyze
         parser_settings: Dictionary of parser settings including reading_level_target
+        include_tree: Also return per-paragraph and per-sentence stats, built in the same pass
         
     Returns:
         TextAnalysis: Complete analysis of the text including statistics and parsed content
     """
-    paragraphs = split_text(text, "paragraph")
-    all_stats = []
-    
-    for i, paragraph in enumerate(paragraphs):
-        stats = analyze_paragraph(paragraph, parser_settings)
-        all_stats.append(stats)
-    
-    # Calculate overall stats
-    overall_stats = {
-        "characters": sum(s["characters"] for s in all_stats),
-        "letters": sum(s["letters"] for s in all_stats),
-        "words": sum(s["words"] for s in all_stats),
-        "sentences": sum(s["sentences"] for s in all_stats),
-        "paragraphs": len(paragraphs),
+    result, paragraphs = _analyze(text, parser_settings, include_tree, with_paragraphs=True)
+    profiler = _profiler
+    if profiler is None:
+        return result.to_model(text, paragraphs)
+    mark = time.perf_counter()
+    model = result.to_model(text, paragraphs)
+    profiler.add("result_build", time.perf_counter() - mark)
+    return model
+
+def _empty_stats():
+    return {
+        "characters": 0,
+        "letters": 0,
+        "words": 0,
+        "sentences": 0,
+        "paragraphs": 0,
         "highlights": {
-            "adverbs": sum(s["highlights"]["adverbs"] for s in all_stats),
-            "complex_words": sum(s["highlights"]["complex_words"] for s in all_stats),
-            "grammar_issues": sum(s["highlights"]["grammar_issues"] for s in all_stats),
-            "hard_sentences": sum(s["highlights"]["hard_sentences"] for s in all_stats),
-            "passive_voices": sum(s["highlights"]["passive_voices"] for s in all_stats),
-            "qualifiers": sum(s["highlights"]["qualifiers"] for s in all_stats),
-            "very_hard_sentences": sum(s["highlights"]["very_hard_sentences"] for s in all_stats)
+            "adverbs": 0,
+            "complex_words": 0,
+            "grammar_issues": 0,
+            "hard_sentences": 0,
+            "passive_voices": 0,
+            "qualifiers": 0,
+            "very_hard_sentences": 0,
+            "complex_word_counts": {}
         }
     }
-    
-    # Calculate additional metrics
-    overall_stats["reading_level"] = calculate_reading_level(overall_stats)
-    overall_stats["readability"] = get_readability_level(
-        overall_stats["reading_level"],
-        parser_settings,
-        overall_stats["words"]
+
+def _last_sentence_start(text, start):
+    """
+    Return the last position >= start at which a sentence begins after a
+    complete sentence delimiter, or 0 if there is none.
+
+    A sentence delimiter is complete once a character that is neither
+    punctuation nor whitespace follows it; nothing appended later can change
+    how the text before that character is split.
+    """
+    position = len(text) - 1
+    while position >= start:
+        char = text[position]
+        if char in ".!?" or char.isspace():
+            position -= 1
+            continue
+        before = position - 1
+        while before >= 0 and text[before].isspace():
+            before -= 1
+        if before >= 0 and text[before] in ".!?":
+            return position
+        position = before
+    return 0
+
+class IncrementalAnalyzer:
+    """
+    Analyze text as it is generated, one chunk at a time.
+
+    Completed paragraphs and sentences are folded into running totals as soon
+    as later text proves they cannot change; only the unfinished trailing
+    sentence is kept and re-analyzed by snapshot(). For every prefix fed so
+    far, snapshot() equals analyze_text_fast(prefix, parser_settings).stats.
+
+    Example:
+        analyzer = IncrementalAnalyzer({"reading_level_target": "NORMAL"})
+        for chunk in stream:
+            analyzer.feed(chunk)
+            if analyzer.snapshot().reading_level > 14:
+                break
+    """
+
+    def __init__(self, parser_settings: Dict[str, str]):
+        self.parser_settings = parser_settings
+        self._totals = _empty_stats()  # finalized sentences and closed paragraphs
+        self._paragraph_open = False   # current paragraph already has finalized sentences
+        self._in_break = False         # the text so far ends inside a paragraph break
+        self._tail = ""                # unfinished text of the current paragraph
+
+    def _add_sentences(self, totals, text):
+        for sentence in split_text(text, "sentence"):
+            stats = analyze_sentence(sentence, self.parser_settings)
+            totals["characters"] += stats["characters"]
+            totals["letters"] += stats["letters"]
+            totals["words"] += stats["words"]
+            totals["sentences"] += 1
+            _add_highlights(totals["highlights"], stats["highlights"])
+
+    def _add_paragraph_end(self, totals, text):
+        """Fold the last piece of the current paragraph into totals."""
+        if not self._paragraph_open and not text:
+            return
+        totals["paragraphs"] += 1
+        for paragraph in split_text(text, "paragraph"):
+            self._add_sentences(totals, paragraph)
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next piece of generated text."""
+        if self._in_break:
+            chunk = chunk.lstrip("\n")
+            if not chunk:
+                return
+            self._in_break = False
+        start = len(self._tail)
+        self._tail += chunk
+
+        index = self._tail.find("\n\n", max(start - 1, 0))
+        while index >= 0:
+            self._add_paragraph_end(self._totals, self._tail[:index])
+            self._paragraph_open = False
+            self._tail = self._tail[index:].lstrip("\n")
+            if not self._tail:
+                self._in_break = True
+                return
+            start = 0
+            index = self._tail.find("\n\n")
+
+        cut = _last_sentence_start(self._tail, start)
+        if cut:
+            self._add_sentences(self._totals, self._tail[:cut])
+            self._paragraph_open = True
+            self._tail = self._tail[cut:]
+
+    def snapshot(self) -> FastTextStats:
+        """Return stats for everything fed so far, as if the text ended here."""
+        totals = combine_stats(self._totals, _empty_stats())
+        self._add_paragraph_end(totals, self._tail)
+        return _text_stats(totals, self.parser_settings)
+
+class AnalysisCache:
+    """
+    Bounded LRU memoization layer around analyze_text_fast.
+
+    Entries are keyed by a BLAKE2 digest of the text and the parser settings,
+    so the cache never holds on to the input strings themselves. Lookups and
+    updates are guarded by a lock; the analysis itself runs outside it, so
+    threads never wait on each other's work. Each process keeps its own
+    entries: a forked or unpickled copy starts empty with fresh counters.
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._reset()
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._pid = os.getpid()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.maxsize = state["maxsize"]
+        self._reset()
+
+    @staticmethod
+    def key(text: str, parser_settings: Dict[str, str], include_tree: bool = False) -> bytes:
+        """Return the content hash used as cache key."""
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16)
+        digest.update(repr((sorted(parser_settings.items()), include_tree)).encode("utf-8"))
+        return digest.digest()
+
+    def analyze(self, text: str, parser_settings: Dict[str, str], include_tree: bool = False) -> FastTextAnalysis:
+        """Return analyze_text_fast(text, parser_settings, include_tree), computing it only on a miss."""
+        if self._pid != os.getpid():
+            self._reset()
+        key = self.key(text, parser_settings, include_tree)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = analyze_text_fast(text, parser_settings, include_tree=include_tree)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+ANALYSIS_CACHE = AnalysisCache()
+
+def analyze_text_cached(text: str, parser_settings: Dict[str, str], include_tree: bool = False) -> FastTextAnalysis:
+    """
+    Memoized analyze_text_fast backed by the module-level ANALYSIS_CACHE.
+
+    Reward functions scoring the same completion share one analysis instead of
+    re-analyzing it each time.
+    """
+    return ANALYSIS_CACHE.analyze(text, parser_settings, include_tree=include_tree)
+
+# Batch analysis on persistent process pools, one per worker count. Workers
+# are forked on Linux, so they inherit the already-compiled lexicon indexes
+# and never re-import the caller's main module.
+BATCH_MIN_PARALLEL_CHARS = 20_000  # below this, in-process analysis beats pool overhead
+BATCH_MAX_CHUNK_CHARS = 64_000     # upper bound on characters sent per task
+BATCH_CHUNKS_PER_WORKER = 4        # enough tasks per worker to even out long texts
+
+_pools = {}  # worker count -> ProcessPoolExecutor
+_pools_pid = None
+_pool_lock = threading.Lock()
+
+def get_pool_context():
+    """
+    The multiprocessing context for worker pools.
+
+    fork only on Linux: forking a threaded process is unsafe on macOS, so
+    other platforms use forkserver where available and spawn otherwise.
+    """
+    import multiprocessing
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def _warm_worker():
+    """Pool initializer: run one analysis so every code path is loaded before real work."""
+    analyze_text_fast("Warm up the analyzer.", {"reading_level_target": "NORMAL"})
+
+def _analyze_chunk(texts, parser_settings, include_tree):
+    return [analyze_text_fast(text, parser_settings, include_tree) for text in texts]
+
+def get_analysis_pool(workers: int) -> "ProcessPoolExecutor":
+    """
+    Return the shared, pre-warmed analysis pool with this many workers.
+
+    Pools persist between calls, one per worker count, so callers asking for
+    different counts never disturb each other's work. A forked child of the
+    process that created them starts over with its own pools.
+    """
+    global _pools_pid
+    with _pool_lock:
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+        pool = _pools.get(workers)
+        if pool is not None:
+            return pool
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_pool_context(), initializer=_warm_worker)
+        # Start every worker now rather than on first use
+        for future in [pool.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+        _pools[workers] = pool
+        return pool
+
+def shutdown_analysis_pool():
+    """Shut down every shared analysis pool running in this process."""
+    global _pools_pid
+    with _pool_lock:
+        if _pools_pid == os.getpid():
+            for pool in _pools.values():
+                pool.shutdown(wait=True, cancel_futures=True)
+        _pools.clear()
+        _pools_pid = None
+
+atexit.register(shutdown_analysis_pool)
+
+def plan_batch_chunks(texts: List[str], workers: int) -> List[range]:
+    """
+    Split a batch into contiguous index ranges, one per pool task.
+
+    Short texts are grouped so each task carries enough work to amortize the
+    IPC cost; long texts get a task of their own. The target chunk size also
+    leaves a few tasks per worker so one long text does not stall the batch.
+    """
+    total_chars = sum(len(text) for text in texts)
+    target = max(1, min(BATCH_MAX_CHUNK_CHARS, total_chars // (workers * BATCH_CHUNKS_PER_WORKER)))
+    chunks = []
+    start = 0
+    size = 0
+    for index, text in enumerate(texts):
+        if size and size + len(text) > target:
+            chunks.append(range(start, index))
+            start = index
+            size = 0
+        size += len(text)
+        if size >= target:
+            chunks.append(range(start, index + 1))
+            start = index + 1
+            size = 0
+    if start < len(texts):
+        chunks.append(range(start, len(texts)))
+    return chunks
+
+def analyze_batch(
+    texts: List[str],
+    parser_settings: Dict[str, str],
+    workers: Optional[int] = None,
+    include_tree: bool = False,
+) -> List[FastTextAnalysis]:
+    """
+    Analyze many texts, fanning out across the shared process pool.
+
+    Args:
+        texts: The texts to analyze
+        parser_settings: Dictionary of parser settings including reading_level_target
+        workers: Number of worker processes (defaults to the CPU count)
+        include_tree: Also return per-paragraph and per-sentence stats
+
+    Returns:
+        List[FastTextAnalysis]: One result per text, in input order
+    """
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(texts) < 2 or sum(len(text) for text in texts) < BATCH_MIN_PARALLEL_CHARS:
+        return _analyze_chunk(texts, parser_settings, include_tree)
+
+    pool = get_analysis_pool(workers)
+    futures = [
+        pool.submit(_analyze_chunk, texts[chunk.start:chunk.stop], parser_settings, include_tree)
+        for chunk in plan_batch_chunks(texts, workers)
+    ]
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+# Long documents are cut at paragraph breaks and analyzed on the same pool.
+# Paragraph counts combine exactly, and the derived metrics are computed once
+# from the merged totals, so the result matches serial analysis.
+LONG_TEXT_MIN_PARALLEL_CHARS = 50_000  # below this, one process is faster
+LONG_TEXT_MIN_CHUNK_CHARS = 16_000     # smallest piece worth a pool task
+
+def plan_text_chunks(text: str, target_chars: int) -> List[range]:
+    """
+    Split text into contiguous ranges of about target_chars characters.
+
+    Every cut is made at the end of a paragraph break, so each chunk splits
+    into exactly the paragraphs it contributes to the whole text.
+    """
+    delimiter = _DELIMITER_RES["paragraph"]
+    chunks = []
+    start = 0
+    while len(text) - start > target_chars:
+        match = delimiter.search(text, start + target_chars)
+        if match is None:
+            break
+        chunks.append(range(start, match.end()))
+        start = match.end()
+    if start < len(text) or not chunks:
+        chunks.append(range(start, len(text)))
+    return chunks
+
+def _analyze_text_chunk(text, offset, parser_settings, include_tree, include_spans):
+    spans = array("I") if include_spans else None
+    totals, tree = _analyze_totals(text, parser_settings, include_tree, spans, offset)
+    return totals, tree, spans
+
+def analyze_long_text(
+    text: str,
+    parser_settings: Dict[str, str],
+    workers: Optional[int] = None,
+    include_tree: bool = False,
+    include_spans: bool = False,
+) -> FastTextAnalysis:
+    """
+    Analyze one long document across the shared process pool.
+
+    The text is cut at paragraph breaks, each chunk is analyzed in a worker,
+    and the chunk counts are merged with combine_stats. The result is equal
+    to analyze_text_fast(text, ...) with the same arguments.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(text) < LONG_TEXT_MIN_PARALLEL_CHARS:
+        return analyze_text_fast(text, parser_settings, include_tree, include_spans)
+
+    target = max(LONG_TEXT_MIN_CHUNK_CHARS, len(text) // (workers * BATCH_CHUNKS_PER_WORKER))
+    pool = get_analysis_pool(workers)
+    futures = [
+        pool.submit(
+            _analyze_text_chunk, text[chunk.start:chunk.stop], chunk.start,
+            parser_settings, include_tree, include_spans
+        )
+        for chunk in plan_text_chunks(text, target)
+    ]
+    totals = _empty_stats()
+    tree = [] if include_tree else None
+    spans = array("I") if include_spans else None
+    for future in futures:
+        chunk_totals, chunk_tree, chunk_spans = future.result()
+        accumulate_stats(totals, chunk_totals)
+        if include_tree:
+            tree.extend(chunk_tree)
+        if include_spans:
+            spans.extend(chunk_spans)
+    return FastTextAnalysis(
+        stats=_text_stats(totals, parser_settings),
+        paragraph_stats=tree,
+        spans=spans
     )
-    overall_stats["reading_time_in_secs"] = overall_stats["words"] / 250 * 60
-    
-    return TextAnalysis(
-        stats=TextStats(
-            characters=overall_stats["characters"],
-            letters=overall_stats["letters"],
-            words=overall_stats["words"],
-            sentences=overall_stats["sentences"],
-            paragraphs=overall_stats["paragraphs"],
-            highlights=Highlights(
-                adverbs=overall_stats["highlights"]["adverbs"],
-                complex_words=overall_stats["highlights"]["complex_words"],
-                grammar_issues=overall_stats["highlights"]["grammar_issues"],
-                hard_sentences=overall_stats["highlights"]["hard_sentences"],
-                passive_voices=overall_stats["highlights"]["passive_voices"],
-                qualifiers=overall_stats["highlights"]["qualifiers"],
-                very_hard_sentences=overall_stats["highlights"]["very_hard_sentences"]
-            ),
-            reading_level=overall_stats["reading_level"],
-            readability=overall_stats["readability"],
-            reading_time_in_secs=overall_stats["reading_time_in_secs"]
-        ),
-        paragraphs=paragraphs,
-        text=text
-    ) 
\ No newline at end of file
+
+# asyncio front end. Analysis runs on an executor so the event loop never
+# blocks; a per-loop semaphore bounds the work in flight and makes callers
+# wait (backpressure) once the limit is reached.
+ASYNC_MAX_IN_FLIGHT_PER_WORKER = 4
+
+class AsyncAnalyzer:
+    """
+    Run analyses from asyncio code on a thread or process executor.
+
+    kind="process" uses the shared analysis pool (see get_analysis_pool) and
+    scales across cores; kind="thread" uses a private thread pool, which
+    keeps the loop responsive but shares the GIL. At most max_in_flight
+    tasks are submitted at once; further requests wait their turn.
+    """
+
+    def __init__(self, kind: str = "process", workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"kind must be 'thread' or 'process', not {kind!r}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or self.workers * ASYNC_MAX_IN_FLIGHT_PER_WORKER
+        self._executor = None
+        self._semaphores = weakref.WeakKeyDictionary()  # event loop -> asyncio.Semaphore
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self.kind == "process":
+                return get_analysis_pool(self.workers)
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hemingway")
+            return self._executor
+
+    def _get_semaphore(self, loop):
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            import asyncio
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+        return semaphore
+
+    async def _run(self, func, *args):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    async def analyze(self, text: str, parser_settings: Dict[str, str], include_tree: bool = False) -> FastTextAnalysis:
+        """Analyze one text like analyze_text_fast without blocking the event loop."""
+        return await self._run(analyze_text_fast, text, parser_settings, include_tree)
+
+    async def analyze_batch(
+        self, texts: List[str], parser_settings: Dict[str, str], include_tree: bool = False
+    ) -> List[FastTextAnalysis]:
+        """Analyze many texts in grouped tasks; results are in input order."""
+        import asyncio
+        texts = list(texts)
+        chunks = await asyncio.gather(*(
+            self._run(_analyze_chunk, texts[chunk.start:chunk.stop], parser_settings, include_tree)
+            for chunk in plan_batch_chunks(texts, self.workers)
+        ))
+        return [result for chunk in chunks for result in chunk]
+
+    def shutdown(self) -> None:
+        """Stop the private thread pool; the shared process pool is left running."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self._semaphores.clear()
+
+_async_analyzer = None
+
+def configure_async_analysis(
+    kind: str = "process", workers: Optional[int] = None, max_in_flight: Optional[int] = None
+) -> AsyncAnalyzer:
+    """Replace the AsyncAnalyzer used by analyze_text_async and analyze_batch_async."""
+    global _async_analyzer
+    previous = _async_analyzer
+    _async_analyzer = AsyncAnalyzer(kind, workers, max_in_flight)
+    if previous is not None:
+        previous.shutdown()
+    return _async_analyzer
+
+def get_async_analyzer() -> AsyncAnalyzer:
+    """Return the default AsyncAnalyzer, creating a process-backed one on first use."""
+    if _async_analyzer is None:
+        return configure_async_analysis()
+    return _async_analyzer
+
+async def analyze_text_async(
+    text: str, parser_settings: Dict[str, str], include_tree: bool = False
+) -> FastTextAnalysis:
+    """Coroutine version of analyze_text_fast, run on the default AsyncAnalyzer."""
+    return await get_async_analyzer().analyze(text, parser_settings, include_tree)
+
+async def analyze_batch_async(
+    texts: List[str], parser_settings: Dict[str, str], include_tree: bool = False
+) -> List[FastTextAnalysis]:
+    """Coroutine version of analyze_batch, run on the default AsyncAnalyzer."""
+    return await get_async_analyzer().analyze_batch(texts, parser_settings, include_tree)
+
+# Corpus mode: one UTF-8 file far larger than memory, analyzed as a single
+# document. Windows end right after a run of newlines; "\n" never occurs
+# inside a multi-byte UTF-8 sequence, so every window decodes on its own and
+# splits into exactly the paragraphs it contributes to the whole file.
+CORPUS_WINDOW_BYTES = 4 << 20
+
+def iter_corpus_windows(buffer, window_bytes: int = CORPUS_WINDOW_BYTES):
+    """Yield (start, end) byte ranges of about window_bytes, cut at paragraph breaks."""
+    size = len(buffer)
+    start = 0
+    while size - start > window_bytes:
+        index = buffer.find(b"\n\n", start + window_bytes)
+        if index < 0:
+            break
+        end = index + 2
+        while end < size and buffer[end] == 0x0A:
+            end += 1
+        yield start, end
+        start = end
+    if start < size:
+        yield start, size
+
+def _release_pages(buffer, start, end):
+    """Drop mapped pages in [start, end) from this process; they stay in the page cache."""
+    start -= start % mmap.PAGESIZE
+    end -= end % mmap.PAGESIZE
+    if end > start and hasattr(mmap, "MADV_DONTNEED"):
+        buffer.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+def _analyze_corpus_window(path, start, end, parser_settings):
+    """Map only [start, end) of path, so the pages are released when it returns."""
+    offset = start - start % mmap.ALLOCATIONGRANULARITY
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), end - offset, offset=offset, access=mmap.ACCESS_READ) as buffer:
+        text = buffer[start - offset:].decode("utf-8", errors="replace")
+    totals, _ = _analyze_totals(text, parser_settings, False)
+    return totals
+
+def analyze_corpus(
+    path: str,
+    parser_settings: Dict[str, str],
+    workers: Optional[int] = 1,
+    window_bytes: int = CORPUS_WINDOW_BYTES,
+) -> FastTextStats:
+    """
+    Analyze a UTF-8 file of any size as one document, without reading it into memory.
+
+    The file is memory-mapped and scanned for paragraph breaks; each window
+    is mapped, decoded and analyzed on its own, and the window counts are
+    merged with accumulate_stats. Resident memory stays around a few windows
+    per worker (a single paragraph longer than window_bytes is one window).
+    The result equals analyze_text_fast(text, parser_settings).stats.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if os.path.getsize(path) == 0:
+        return analyze_text_fast("", parser_settings).stats
+
+    totals = _empty_stats()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        def windows():
+            # Scanning for breaks faults pages (and readahead) into the big
+            # mapping; release them as we go so they do not add up
+            released = 0
+            for start, end in iter_corpus_windows(buffer, window_bytes):
+                yield start, end
+                _release_pages(buffer, released, end)
+                released = end - end % mmap.PAGESIZE
+        if workers <= 1:
+            for start, end in windows():
+                accumulate_stats(totals, _analyze_corpus_window(path, start, end, parser_settings))
+        else:
+            pool = get_analysis_pool(workers)
+            pending = deque()
+            for start, end in windows():
+                pending.append(pool.submit(_analyze_corpus_window, path, start, end, parser_settings))
+                if len(pending) >= workers * 2:
+                    accumulate_stats(totals, pending.popleft().result())
+            while pending:
+                accumulate_stats(totals, pending.popleft().result())
+    return _text_stats(totals, parser_settings)
+
+# Streaming analysis of many documents, used by the command-line entry point.
+STREAM_MAX_CHUNK_RECORDS = 256  # records per pool task, on top of BATCH_MAX_CHUNK_CHARS
+
+STATS_FIELDS = (
+    "characters", "letters", "words", "sentences", "paragraphs",
+    "reading_level", "readability", "reading_time_in_secs",
+)
+HIGHLIGHT_FIELDS = (
+    "adverbs", "complex_words", "grammar_issues", "hard_sentences",
+    "passive_voices", "qualifiers", "very_hard_sentences",
+)
+
+def _read_jsonl(stream, name, text_field):
+    import json
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{name}:{line_number}: invalid JSON: {error}") from None
+        if not isinstance(record, dict) or not isinstance(record.get(text_field), str):
+            raise ValueError(f"{name}:{line_number}: no string field {text_field!r}")
+        yield f"{name}:{line_number}", record[text_field]
+
+def _read_file(path, text_field, jsonl):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        if jsonl or (jsonl is None and path.endswith(".jsonl")):
+            yield from _read_jsonl(f, path, text_field)
+        else:
+            yield path, f.read()
+
+def iter_input_paths(paths, pattern="*.txt"):
+    """Yield paths in order, replacing each directory with its files matching pattern, walked in sorted order."""
+    import fnmatch
+    for path in paths:
+        if path != "-" and os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if fnmatch.fnmatch(name, pattern):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+def iter_input_records(paths, text_field="text", pattern="*.txt", jsonl=None):
+    """
+    Yield (source, text) for every document in paths, in order.
+
+    A path may be a text file (one document), a .jsonl file (one document per
+    line, read from text_field), a directory (files matching pattern, walked
+    in sorted order) or "-" for standard input. jsonl forces (True) or
+    disables (False) JSONL parsing instead of deciding by file extension.
+    """
+    for path in iter_input_paths(paths, pattern):
+        if path == "-":
+            if jsonl:
+                yield from _read_jsonl(sys.stdin, "<stdin>", text_field)
+            else:
+                yield "<stdin>", sys.stdin.read()
+        else:
+            yield from _read_file(path, text_field, jsonl)
+
+def _group_records(records):
+    """Group (source, text) pairs into (sources, texts) pool tasks."""
+    sources, texts, size = [], [], 0
+    for source, text in records:
+        sources.append(source)
+        texts.append(text)
+        size += len(text)
+        if size >= BATCH_MAX_CHUNK_CHARS or len(texts) >= STREAM_MAX_CHUNK_RECORDS:
+            yield sources, texts
+            sources, texts, size = [], [], 0
+    if texts:
+        yield sources, texts
+
+def _analyze_stats_chunk(texts, parser_settings):
+    return [analyze_text_fast(text, parser_settings).stats for text in texts]
+
+def analyze_stream(records, parser_settings: Dict[str, str], workers: Optional[int] = None):
+    """
+    Yield (source, FastTextStats) for each (source, text) record, in input order.
+
+    Records are read lazily and at most a few pool tasks per worker are in
+    flight, so memory stays bounded however long the stream is.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for source, text in records:
+            yield source, analyze_text_fast(text, parser_settings).stats
+        return
+
+    pool = get_analysis_pool(workers)
+    pending = deque()
+    for sources, texts in _group_records(records):
+        pending.append((sources, pool.submit(_analyze_stats_chunk, texts, parser_settings)))
+        if len(pending) >= workers * BATCH_CHUNKS_PER_WORKER:
+            sources, future = pending.popleft()
+            yield from zip(sources, future.result())
+    while pending:
+        sources, future = pending.popleft()
+        yield from zip(sources, future.result())
+
+def stats_row(source: str, stats: FastTextStats) -> Dict[str, object]:
+    """Flatten one document's stats into a row for JSONL or CSV output."""
+    row = {"source": source}
+    for name in STATS_FIELDS:
+        row[name] = stats[name]
+    for name in HIGHLIGHT_FIELDS:
+        row[name] = stats.highlights[name]
+    return row
+
+def _parse_settings(value):
+    """--settings accepts a JSON object or the path of a JSON file."""
+    import argparse
+    import json
+    try:
+        if os.path.isfile(value):
+            with open(value) as f:
+                settings = json.load(f)
+        else:
+            settings = json.loads(value)
+    except (OSError, ValueError) as error:
+        raise argparse.ArgumentTypeError(f"invalid settings: {error}")
+    if not isinstance(settings, dict):
+        raise argparse.ArgumentTypeError("settings must be a JSON object")
+    target = settings.setdefault("reading_level_target", "NORMAL")
+    if target not in READABILITY_LEVELS:
+        raise argparse.ArgumentTypeError(
+            f"reading_level_target must be one of {', '.join(READABILITY_LEVELS)}, not {target!r}"
+        )
+    try:
+        get_lexicons(settings)
+    except (OSError, ValueError) as error:
+        raise argparse.ArgumentTypeError(f"invalid lexicons: {error}")
+    return settings
+
+class _Progress:
+    """Periodic documents/sec and MB/sec report on stderr."""
+
+    def __init__(self, stream, interval=1.0):
+        self.stream = stream
+        self.interval = interval
+        self.documents = 0
+        self.characters = 0
+        self.start = self.last = time.perf_counter()
+
+    def count(self, records):
+        for source, text in records:
+            self.characters += len(text)
+            yield source, text
+
+    def update(self, final=False):
+        self.documents += not final
+        now = time.perf_counter()
+        if self.stream is None or not final and now - self.last < self.interval:
+            return
+        self.last = now
+        elapsed = max(now - self.start, 1e-9)
+        megabytes = self.characters / 1e6
+        self.stream.write(
+            f"\r{self.documents} docs  {megabytes:.1f} MB read  "
+            f"{self.documents / elapsed:.1f} docs/s  {megabytes / elapsed:.2f} MB/s"
+            + ("\n" if final else "")
+        )
+        self.stream.flush()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import csv
+    import json
+    parser = argparse.ArgumentParser(
+        description="Analyze text files, directories or JSONL streams and write one stats row per document."
+    )
+    parser.add_argument("paths", nargs="*", default=["-"], help='files, directories or "-" for stdin (default)')
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=("jsonl", "csv"), default="jsonl", help="output format")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--jsonl", action="store_true", default=None, help="treat every input as JSONL")
+    parser.add_argument("--field", default="text", help='JSONL field holding the text (default: "text")')
+    parser.add_argument("--glob", default="*.txt", help='file pattern inside directories (default: "*.txt")')
+    parser.add_argument(
+        "--settings", type=_parse_settings, default={"reading_level_target": "NORMAL"},
+        help='parser settings as JSON or a JSON file, e.g. \'{"reading_level_target": "TECHNICAL"}\''
+    )
+    parser.add_argument(
+        "--corpus", action="store_true",
+        help="analyze each file as one memory-mapped document (for corpora larger than memory)"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress report")
+    args = parser.parse_args(argv)
+    if args.corpus and "-" in args.paths:
+        parser.error("--corpus memory-maps files; it cannot read standard input")
+
+    progress = _Progress(None if args.quiet else sys.stderr)
+    records = progress.count(iter_input_records(args.paths, args.field, args.glob, args.jsonl))
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "csv":
+            writer = csv.DictWriter(output, fieldnames=("source",) + STATS_FIELDS + HIGHLIGHT_FIELDS)
+            writer.writeheader()
+            write = writer.writerow
+        else:
+            write = lambda row: output.write(json.dumps(row) + "\n")
+        if args.corpus:
+            def results_for_corpus():
+                for path in iter_input_paths(args.paths, args.glob):
+                    progress.characters += os.path.getsize(path)
+                    yield path, analyze_corpus(path, args.settings, args.workers)
+            results = results_for_corpus()
+        else:
+            results = analyze_stream(records, args.settings, args.workers)
+        try:
+            for source, stats in results:
+                write(stats_row(source, stats))
+                progress.update()
+        except (ValueError, OSError) as error:
+            # A malformed record or unreadable path ends the run with its location, not a traceback
+            parser.exit(1, f"{parser.prog}: error: {error}\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    progress.update(final=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Pydantic models for hemingway analysis results.
+
+Imported lazily by hemingway (hemingway.TextAnalysis etc. resolve here) so
+that analysis-only processes never load pydantic.
+"""
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+class Highlights(BaseModel):
+    adverbs: int = Field(description="Count of adverbs found in the text")
+    complex_words: int = Field(description="Count of complex words")
+    grammar_issues: int = Field(description="Count of grammar issues detected")
+    hard_sentences: int = Field(description="Count of sentences marked as hard to read")
+    passive_voices: int = Field(description="Count of passive voice constructions")
+    qualifiers: int = Field(description="Count of qualifying/weak phrases")
+    very_hard_sentences: int = Field(description="Count of sentences marked as very hard to read")
+    complex_word_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Occurrences of each wordy phrase counted in complex_words"
+    )
+    complex_word_suggestions: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Suggested simpler replacements for each wordy phrase found"
+    )
+
+    model_config = {
+        "populate_by_name": True
+    }
+
+class TextStats(BaseModel):
+    characters: int = Field(description="Total number of characters")
+    letters: int = Field(description="Total number of letters")
+    words: int = Field(description="Total number of words")
+    sentences: int = Field(description="Total number of sentences")
+    paragraphs: int = Field(description="Total number of paragraphs")
+    highlights: Highlights = Field(description="Analysis highlights of writing issues")
+    reading_level: int = Field(description="Calculated reading level score")
+    readability: str = Field(description="Readability assessment (normal, hard, or very_hard)")
+    reading_time_in_secs: float = Field(description="Estimated reading time in seconds")
+
+    model_config = {
+        "populate_by_name": True
+    }
+
+class SentenceStats(BaseModel):
+    characters: int = Field(description="Number of characters in the sentence")
+    letters: int = Field(description="Number of letters in the sentence")
+    words: int = Field(description="Number of words in the sentence")
+    highlights: Highlights = Field(description="Writing issues found in the sentence")
+
+    model_config = {
+        "populate_by_name": True
+    }
+
+class ParagraphStats(BaseModel):
+    characters: int = Field(description="Number of characters in the paragraph")
+    letters: int = Field(description="Number of letters in the paragraph")
+    words: int = Field(description="Number of words in the paragraph")
+    sentences: int = Field(description="Number of sentences in the paragraph")
+    highlights: Highlights = Field(description="Writing issues found in the paragraph")
+    sentence_stats: List[SentenceStats] = Field(description="Per-sentence statistics, in order")
+
+    model_config = {
+        "populate_by_name": True
+    }
+
+class TextAnalysis(BaseModel):
+    stats: TextStats = Field(description="Overall statistics of the analyzed text")
+    paragraphs: List[str] = Field(description="List of paragraphs in the text")
+    text: str = Field(description="The original input text")
+    paragraph_stats: Optional[List[ParagraphStats]] = Field(
+        default=None,
+        description="Per-paragraph statistics with nested per-sentence statistics, if requested"
+    )
+
+    model_config = {
+        "populate_by_name": True
+    }
+
+    def __getitem__(self, key):
+        # Only serialize the requested field; the paragraph tree can be large
+        return self.model_dump(include={key})[key]
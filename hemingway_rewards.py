@@ -0,0 +1,192 @@
+"""
+Hemingway-style reward functions for GRPO, scored in one pass per completion.
+
+RewardTable scans each completion once, computes all five rewards from
+that scan, and keeps the result for the step. reward_funcs() returns
+one callable view per reward, so GRPOTrainer still logs them separately:
+
+    table = RewardTable(count_tokens)
+    trainer = MyS1GRPOTrainer(..., reward_funcs=table.reward_funcs(), ...)
+
+The module-level reward_table and the five *_reward_func functions are the
+ones train_hemingway.py trains with. They count tokens with the
+REWARD_TOKENIZER tokenizer, which is loaded on first use, and only when
+the trainer does not pass completion_ids. Importing this module loads
+neither transformers nor a tokenizer.
+"""
+from typing import Callable, Dict, List, Optional, Sequence
+
+from hemingway import analyze_text_outline, calculate_reading_level, get_readability_level
+
+REWARD_SETTINGS = {"reading_level_target": "NORMAL"}
+REWARD_NAMES = ("readability", "conciseness", "active_voice", "token_length", "paragraph_structure")
+TOKENS_PER_REWARD = 500  # token_length reward grows by 1 per this many tokens
+REWARD_TOKENIZER = "Qwen/Qwen2.5-14B-Instruct"
+
+def readability_reward(reading_level: int, readability: str) -> float:
+    """Reward clearer, more readable writing."""
+    reward = 0.0
+    if 6 <= reading_level <= 10:  # Hemingway-like clarity
+        reward += 0.5
+    elif reading_level > 12:      # Too complex
+        reward -= 0.3
+    if readability == "very_hard":
+        reward -= 0.4
+    return reward
+
+def conciseness_reward(words: int, sentences: int) -> float:
+    """Reward 15-20 words per sentence; penalize longer averages."""
+    words_per_sentence = words / max(1, sentences)
+    if 15 <= words_per_sentence <= 20:
+        return 0.3
+    if 20 < words_per_sentence < 25:
+        return -0.3
+    if 25 < words_per_sentence:
+        return -0.6
+    return 0.0
+
+def active_voice_reward(passive_voices: int) -> float:
+    """Bonus for no passive voice, else a penalty per passive."""
+    return 0.5 if passive_voices == 0 else -passive_voices * 0.1
+
+def token_length_reward(token_count: int) -> float:
+    """Reward longer completions linearly."""
+    return token_count / TOKENS_PER_REWARD
+
+def paragraph_structure_reward(paragraph_sentences: Sequence[int]) -> float:
+    """Reward a 2-4 sentence opening paragraph and 3-7 sentence paragraphs after it."""
+    if not paragraph_sentences:
+        return 0.0
+    first = paragraph_sentences[0]
+    if first == 1:
+        reward = 0.1    # Too short but better than nothing
+    elif first == 2 or first == 4:
+        reward = 0.3    # Good
+    elif first == 3:
+        reward = 0.5    # Perfect
+    else:
+        reward = -0.25  # Too long
+    for sentences in paragraph_sentences[1:]:
+        if sentences < 3:
+            reward -= 0.1  # Too short
+        elif sentences <= 5:
+            reward += 0.3  # Perfect
+        elif sentences <= 7:
+            reward += 0.1  # Acceptable
+        else:
+            reward -= 0.3  # Too long
+    return min(0.5, reward)
+
+def reward_features(text: str) -> tuple:
+    """
+    Return (letters, words, sentences, passive voices, sentences per paragraph) for text.
+
+    These are the only analysis results the rewards use; analyze_text_outline
+    computes them without building the per-sentence tree.
+    """
+    stats, paragraph_sentences = analyze_text_outline(text, REWARD_SETTINGS)
+    return stats.letters, stats.words, stats.sentences, stats.highlights.passive_voices, paragraph_sentences
+
+def score_text(text: str, token_count: int = 0) -> tuple:
+    """Return the five rewards for one completion, in REWARD_NAMES order."""
+    if not text:
+        return (0.0, 0.0, 0.0, 0.0, 0.0)
+    letters, words, sentences, passives, paragraph_sentences = reward_features(text)
+    reading_level = calculate_reading_level({"letters": letters, "words": words, "sentences": sentences})
+    return (
+        readability_reward(reading_level, get_readability_level(reading_level, REWARD_SETTINGS, words)),
+        conciseness_reward(words, sentences),
+        active_voice_reward(passives),
+        token_length_reward(token_count),
+        paragraph_structure_reward(paragraph_sentences),
+    )
+
+def tokenizer_token_counter(tokenizer) -> Callable[[List[str]], List[int]]:
+    """A RewardTable count_tokens that makes one batched call to a Hugging Face tokenizer."""
+    def count_tokens(texts):
+        return tokenizer(texts, return_length=True, return_attention_mask=False)["length"]
+    return count_tokens
+
+class RewardTable:
+    """
+    Per-step table of all five rewards for a group of completions.
+
+    Token counts come from the trainer's completion_ids when it passes them.
+    Otherwise count_tokens maps the list of texts to token counts in one call;
+    when it is None, the token_length reward is 0. The table for the most
+    recent completions is kept, so the reward functions called after the
+    first one in a step only look up their column.
+    """
+
+    def __init__(self, count_tokens: Optional[Callable[[List[str]], List[int]]] = None):
+        self.count_tokens = count_tokens
+        self._last = None  # (texts, columns), replaced as a whole
+
+    def score(self, completions, completion_ids=None) -> Dict[str, List[float]]:
+        """Return {reward name: rewards} for completions, reusing the last step's table."""
+        texts = tuple(completion[0]["content"] for completion in completions)
+        last = self._last
+        if last is not None and last[0] == texts:
+            return last[1]
+        if completion_ids is not None:
+            token_counts = [len(ids) for ids in completion_ids]
+        elif self.count_tokens is not None and any(texts):
+            token_counts = self.count_tokens(list(texts))
+        else:
+            token_counts = [0] * len(texts)
+        rows = [score_text(text, count) for text, count in zip(texts, token_counts)]
+        columns = {name: [row[index] for row in rows] for index, name in enumerate(REWARD_NAMES)}
+        self._last = (texts, columns)
+        return columns
+
+    def clear(self):
+        self._last = None
+
+    def __getstate__(self):
+        return {**self.__dict__, "_last": None}  # a copy starts with no cached step
+
+    def reward_funcs(self) -> List[Callable]:
+        """One RewardView per REWARD_NAMES entry, named <name>_reward_func."""
+        return [RewardView(self, name) for name in REWARD_NAMES]
+
+class RewardView:
+    """
+    One column of a RewardTable, called like a reward function.
+
+    Views pickle with their table (and its count_tokens), so they can be sent
+    to spawned worker processes; views pickled together share one table.
+    """
+
+    def __init__(self, table: RewardTable, name: str):
+        self.table = table
+        self.name = name
+        self.__name__ = self.__qualname__ = f"{name}_reward_func"
+
+    def __call__(self, completions, **kwargs) -> list[float]:
+        return self.table.score(completions, kwargs.get("completion_ids"))[self.name]
+
+    def __repr__(self):
+        return f"<RewardView {self.__name__}>"
+
+_tokenizer = None
+
+def get_reward_tokenizer():
+    """Load REWARD_TOKENIZER on first use."""
+    global _tokenizer
+    if _tokenizer is None:
+        from transformers import AutoTokenizer
+        _tokenizer = AutoTokenizer.from_pretrained(REWARD_TOKENIZER)
+    return _tokenizer
+
+def count_tokens(texts: List[str]) -> List[int]:
+    return tokenizer_token_counter(get_reward_tokenizer())(texts)
+
+# One fused pass scores every reward; each function below is a view of its column.
+reward_table = RewardTable(count_tokens)
+(
+    readability_reward_func,
+    conciseness_reward_func,
+    active_voice_reward_func,
+    token_length_reward_func,
+    paragraph_structure_reward_func,
+) = reward_table.reward_funcs()
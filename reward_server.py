@@ -0,0 +1,370 @@
+#!/opt/homebrew/bin/python3.12
+"""
+Local reward server: score completions outside the training process.
+
+    python reward_server.py --port 8765 --workers 4
+
+The server exposes a set of reward functions over localhost HTTP. Requests
+arriving together are coalesced into one micro-batch, which is split across
+a process pool; every reward function runs on each shard, and each caller
+gets back its own slice of every reward vector.
+
+In the trainer, swap the reward functions for thin clients:
+
+    client = RewardClient("http://127.0.0.1:8765")
+    trainer = MyS1GRPOTrainer(..., reward_funcs=client.reward_funcs(), ...)
+
+The client sends a step's completions once and serves every reward function
+from that single response.
+"""
+import argparse
+import importlib
+import json
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence
+
+from hemingway import get_pool_context
+
+DEFAULT_REWARD_FUNCS = ("hemingway_rewards:reward_table",)
+
+def load_reward_funcs(specs: Sequence[str]) -> List[Callable]:
+    """
+    Import reward functions given as "module:function" strings.
+
+    A spec naming an object with a reward_funcs() method (e.g. a RewardTable)
+    expands to all of its reward functions.
+    """
+    funcs = []
+    for spec in specs:
+        module_name, _, func_name = spec.partition(":")
+        if not func_name:
+            raise ValueError(f"reward function must be given as module:function, not {spec!r}")
+        func = getattr(importlib.import_module(module_name), func_name)
+        if hasattr(func, "reward_funcs"):
+            funcs.extend(func.reward_funcs())
+        else:
+            funcs.append(func)
+    return funcs
+
+def score_completions(reward_funcs: Sequence[Callable], completions: list,
+                      completion_ids: Optional[list] = None) -> Dict[str, List[float]]:
+    """Run every reward function over the same completions, keyed by function name."""
+    kwargs = {} if completion_ids is None else {"completion_ids": completion_ids}
+    return {func.__name__: [float(reward) for reward in func(completions, **kwargs)] for func in reward_funcs}
+
+_worker_reward_funcs = None
+
+def _init_worker(reward_funcs):
+    # On Linux workers are forked and inherit the functions, so any closure
+    # works. Elsewhere they are pickled: plain functions must be importable by
+    # name, and RewardTable views pickle with their table.
+    global _worker_reward_funcs
+    _worker_reward_funcs = reward_funcs
+
+def _score_shard(completions, completion_ids):
+    return score_completions(_worker_reward_funcs, completions, completion_ids)
+
+class RewardBatcher:
+    """
+    Coalesce concurrent scoring requests into micro-batches.
+
+    A batch closes once it holds max_batch completions or max_wait seconds
+    after its first request arrived. With workers > 0 each batch is split
+    into contiguous shards scored on a process pool; with workers=0 it is
+    scored on the batcher thread.
+    """
+
+    def __init__(self, reward_funcs: Sequence[Callable], workers: int = 0,
+                 max_batch: int = 64, max_wait: float = 0.005):
+        self.reward_funcs = list(reward_funcs)
+        self.names = [func.__name__ for func in self.reward_funcs]
+        self.workers = workers
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.requests = 0
+        self.batches = 0
+        self.completions = 0
+        self._queue = queue.Queue()
+        self._pool = None
+        if workers > 0:
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=get_pool_context(),
+                initializer=_init_worker, initargs=(self.reward_funcs,)
+            )
+        self._thread = threading.Thread(target=self._run, name="reward-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, completions: list, completion_ids: Optional[list] = None) -> Future:
+        """
+        Queue completions for scoring; the future resolves to {name: rewards}.
+
+        completion_ids are passed on to the reward functions when every
+        request in the batch has them.
+        """
+        future = Future()
+        self._queue.put((completions, completion_ids, future))
+        return future
+
+    def _collect(self):
+        """Block for one request, then gather more until the batch is full or max_wait passes."""
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        size = len(item[0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # let the run loop see the stop signal next
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _score(self, completions, completion_ids):
+        if self._pool is None or len(completions) < 2:
+            return score_completions(self.reward_funcs, completions, completion_ids)
+        shards = min(self.workers, len(completions))
+        bounds = [len(completions) * index // shards for index in range(shards + 1)]
+        futures = [
+            self._pool.submit(
+                _score_shard, completions[start:end],
+                None if completion_ids is None else completion_ids[start:end]
+            )
+            for start, end in zip(bounds, bounds[1:])
+        ]
+        scores = {name: [] for name in self.names}
+        for future in futures:
+            for name, rewards in future.result().items():
+                scores[name].extend(rewards)
+        return scores
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            completions = [completion for request, _, _ in batch for completion in request]
+            if all(ids is not None for _, ids, _ in batch):
+                completion_ids = [ids for _, request_ids, _ in batch for ids in request_ids]
+            else:
+                completion_ids = None
+            self.requests += len(batch)
+            self.batches += 1
+            self.completions += len(completions)
+            try:
+                scores = self._score(completions, completion_ids)
+            except Exception as error:
+                if len(batch) == 1:
+                    batch[0][2].set_exception(error)
+                    continue
+                # Score each request on its own so only the caller that broke the batch gets the error
+                for request, request_ids, future in batch:
+                    try:
+                        future.set_result(self._score(request, request_ids))
+                    except Exception as error:
+                        future.set_exception(error)
+                continue
+            start = 0
+            for request, _, future in batch:
+                end = start + len(request)
+                future.set_result({name: rewards[start:end] for name, rewards in scores.items()})
+                start = end
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+def check_completions(completions, completion_ids=None):
+    """
+    Raise TypeError or ValueError unless completions has the shape reward functions take.
+
+    Each completion is a non-empty list of messages, each message a dict
+    with a string "content", as reward functions read completion[0]["content"];
+    completion_ids, if given, has one list of
+    token ids per completion.
+    """
+    if not isinstance(completions, list):
+        raise TypeError("completions must be a list")
+    for index, completion in enumerate(completions):
+        if not isinstance(completion, list) or not completion or not all(
+            isinstance(message, dict) and isinstance(message.get("content"), str) for message in completion
+        ):
+            raise ValueError(f"completion {index} must be a non-empty list of messages with content")
+    if completion_ids is not None:
+        if not isinstance(completion_ids, list) or len(completion_ids) != len(completions):
+            raise ValueError("completion_ids must have one entry per completion")
+        if not all(isinstance(ids, list) for ids in completion_ids):
+            raise TypeError("each completion_ids entry must be a list of token ids")
+
+class _RewardRequestHandler(BaseHTTPRequestHandler):
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._reply(404, {"error": f"unknown path {self.path}"})
+            return
+        batcher = self.server.batcher
+        self._reply(200, {
+            "reward_funcs": batcher.names,
+            "requests": batcher.requests,
+            "batches": batcher.batches,
+            "completions": batcher.completions,
+        })
+
+    def do_POST(self):
+        if self.path != "/score":
+            self._reply(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            completions = request["completions"]
+            completion_ids = request.get("completion_ids")
+            check_completions(completions, completion_ids)
+        except (ValueError, KeyError, TypeError) as error:
+            self._reply(400, {"error": f"bad request: {error}"})
+            return
+        try:
+            scores = self.server.batcher.submit(completions, completion_ids).result()
+        except Exception as error:
+            self._reply(500, {"error": f"{type(error).__name__}: {error}"})
+            return
+        self._reply(200, {"rewards": scores})
+
+    def log_message(self, format, *args):
+        pass  # one line per request would swamp the trainer's logs
+
+class RewardServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer whose handler threads share one RewardBatcher."""
+    daemon_threads = True
+
+    def __init__(self, address, batcher: RewardBatcher):
+        super().__init__(address, _RewardRequestHandler)
+        self.batcher = batcher
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "RewardServer":
+        """Serve on a background thread and return self."""
+        threading.Thread(target=self.serve_forever, name="reward-server", daemon=True).start()
+        return self
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+        self.batcher.close()
+
+def serve(reward_funcs: Sequence[Callable], host: str = "127.0.0.1", port: int = 0, workers: int = 0,
+          max_batch: int = 64, max_wait: float = 0.005) -> RewardServer:
+    """Create a RewardServer (port 0 picks a free port); call .start() or .serve_forever()."""
+    return RewardServer((host, port), RewardBatcher(reward_funcs, workers, max_batch, max_wait))
+
+class RewardClient:
+    """
+    Thin client for a RewardServer.
+
+    reward_funcs() returns one callable per server-side reward function,
+    named like the original so trainer logs are unchanged. The first of
+    them called for a set of completions fetches every reward vector in one
+    request; the others are answered from that response.
+    """
+
+    def __init__(self, url: str, timeout: float = 300.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._last_key = None
+        self._last_scores = None
+
+    def _request(self, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            self.url + path, data=data, headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            raise RuntimeError(f"reward server error {error.code}: {error.read().decode('utf-8', 'replace')}")
+
+    def health(self) -> dict:
+        return self._request("/health")
+
+    def score(self, completions: list, completion_ids: Optional[list] = None) -> Dict[str, List[float]]:
+        """Return {reward function name: rewards} for completions."""
+        key = json.dumps(completions, sort_keys=True)
+        with self._lock:
+            if key == self._last_key:
+                return self._last_scores
+        payload = {"completions": completions}
+        if completion_ids is not None:
+            payload["completion_ids"] = completion_ids
+        scores = self._request("/score", payload)["rewards"]
+        with self._lock:
+            self._last_key = key
+            self._last_scores = scores
+        return scores
+
+    def reward_funcs(self, names: Optional[Sequence[str]] = None) -> List[Callable]:
+        """Callables with the reward_funcs signature, one per name (default: all served)."""
+        if names is None:
+            names = self.health()["reward_funcs"]
+
+        def make(name):
+            def reward_func(completions, **kwargs) -> list[float]:
+                return self.score(completions, kwargs.get("completion_ids"))[name]
+            reward_func.__name__ = reward_func.__qualname__ = name
+            return reward_func
+
+        return [make(name) for name in names]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve reward functions over localhost HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-j", "--workers", type=int, default=4, help="scoring processes (0: score in the server)")
+    parser.add_argument("--max-batch", type=int, default=64, help="completions per micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="how long a batch waits to fill")
+    parser.add_argument(
+        "--funcs", nargs="+", default=list(DEFAULT_REWARD_FUNCS), help="reward functions as module:function"
+    )
+    args = parser.parse_args(argv)
+
+    server = serve(load_reward_funcs(args.funcs), args.host, args.port, args.workers,
+                   args.max_batch, args.max_wait_ms / 1000)
+    print(f"serving {', '.join(server.batcher.names)} on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""
+Generation helpers for MyS1GRPOTrainer that do not depend on vLLM itself.
+
+The trainer passes in the vLLM generate method and its SamplingParams; tests
+pass in stand-ins with the same interface.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+def plan_generation_buckets(prompt_lengths: Sequence[int], max_tokens: int, max_length: int) -> Dict[int, List[int]]:
+    """
+    Group prompt indices by the max_tokens each one may generate.
+
+    A prompt of n tokens may generate min(max_tokens, max_length - n)
+    tokens. Buckets and the indices in them keep the order prompts first
+    appear in. Raises ValueError if a prompt leaves no room to generate.
+    """
+    buckets = {}
+    for index, length in enumerate(prompt_lengths):
+        allowed = max_length - length
+        if allowed < 1:
+            raise ValueError(f"Prompt too long ({length} tokens); maximum allowed is {max_length - 1}")
+        buckets.setdefault(min(max_tokens, allowed), []).append(index)
+    return buckets
+
+def generate_bucketed(
+    generate: Callable,
+    prompts: Sequence,
+    sampling_params,
+    prompt_lengths: Sequence[int],
+    max_length: int,
+    **kwargs,
+) -> list:
+    """
+    Generate for all prompts in one generate call, each capped to stop before max_length.
+
+    Each max_tokens bucket gets one clone of sampling_params, which its
+    prompts share. When every prompt fits in one bucket, generate gets that
+    single SamplingParams; otherwise it gets one per prompt, as vLLM accepts.
+    Outputs come back in prompt order.
+    """
+    if not prompts:
+        return []
+    buckets = plan_generation_buckets(prompt_lengths, sampling_params.max_tokens, max_length)
+    params = [None] * len(prompts)
+    for max_tokens, indices in buckets.items():
+        bucket_params = sampling_params.clone()
+        bucket_params.max_tokens = max_tokens
+        for index in indices:
+            params[index] = bucket_params
+    return list(generate(list(prompts), sampling_params=params[0] if len(buckets) == 1 else params, **kwargs))
+
+@dataclass(slots=True)
+class ForcedRollout:
+    """One rollout's state during budget forcing."""
+    completion: object       # the generator's completion output, updated in place at the end
+    prompt_token_ids: list
+    token_ids: list
+    finish_reason: str
+    budget: int              # completion tokens this rollout may use in total, cues included
+    rounds: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.budget - len(self.token_ids)
+
+def force_budget(
+    generate: Callable,
+    outputs: list,
+    sampling_params,
+    cue_token_ids: Sequence[int],
+    min_tokens: int,
+    num_ignore: int,
+    max_length: int,
+    stop_token_ids: Sequence[int] = (),
+    decode: Optional[Callable[[List[int]], str]] = None,
+    **kwargs,
+) -> List[ForcedRollout]:
+    """
+    s1-style budget forcing: make rollouts that stopped too early keep going.
+
+    outputs are the generator's per-prompt results (prompt_token_ids plus
+    completions with token_ids and finish_reason). For up to num_ignore
+    rounds, every rollout that stopped before min_tokens, and still has room
+    for the cue, loses its stop token, gets cue_token_ids appended, and is
+    resubmitted as a token-id prompt. The prompt is the original prompt plus
+    everything generated so far, so the engine's prefix cache covers it. Each
+    round is one generate call with per-rollout sampling params capped at
+    that rollout's remaining budget: min(max_tokens, max_length - prompt
+    length) tokens in total.
+
+    The completions in outputs get their final token_ids and finish_reason,
+    and text decoded from those ids with decode (None without it). Their
+    logprobs and cumulative_logprob covered only the first segment and are
+    set to None. The rollout states are returned.
+    """
+    stop_token_ids = frozenset(stop_token_ids)
+    cue_token_ids = list(cue_token_ids)
+    rollouts = []
+    for request in outputs:
+        prompt_token_ids = list(request.prompt_token_ids)
+        budget = min(sampling_params.max_tokens, max_length - len(prompt_token_ids))
+        for completion in request.outputs:
+            rollouts.append(ForcedRollout(
+                completion, prompt_token_ids, list(completion.token_ids), completion.finish_reason, budget
+            ))
+
+    for _ in range(num_ignore):
+        pending = []
+        for rollout in rollouts:
+            if rollout.finish_reason != "stop":
+                continue
+            generated = rollout.token_ids
+            if generated and generated[-1] in stop_token_ids:
+                generated = generated[:-1]
+            if len(generated) >= min_tokens or rollout.budget - len(generated) <= len(cue_token_ids):
+                continue
+            rollout.token_ids = generated + cue_token_ids
+            rollout.rounds += 1
+            pending.append(rollout)
+        if not pending:
+            break
+
+        prompts = []
+        params = []
+        for rollout in pending:
+            prompts.append({"prompt_token_ids": rollout.prompt_token_ids + rollout.token_ids})
+            rollout_params = sampling_params.clone()
+            rollout_params.n = 1
+            rollout_params.max_tokens = rollout.remaining
+            if hasattr(rollout_params, "min_tokens"):
+                rollout_params.min_tokens = 0  # stopping early again is what the next round handles
+            params.append(rollout_params)
+        for rollout, result in zip(pending, generate(prompts, sampling_params=params, **kwargs)):
+            continuation = result.outputs[0]
+            rollout.token_ids.extend(continuation.token_ids)
+            rollout.finish_reason = continuation.finish_reason
+
+    for rollout in rollouts:
+        if rollout.rounds:
+            completion = rollout.completion
+            completion.token_ids = rollout.token_ids
+            completion.finish_reason = rollout.finish_reason
+            completion.text = decode(rollout.token_ids) if decode is not None else None
+            completion.logprobs = completion.cumulative_logprob = None
+    return rollouts
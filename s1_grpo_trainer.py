@@ -2,6 +2,8 @@ from trl.trainer.grpo_trainer import GRPOTrainer
 from vllm import SamplingParams
 from transformers import AutoTokenizer
 
+from s1_generation import force_budget, generate_bucketed
+
 
 class MyS1GRPOTrainer(GRPOTrainer):
     """
@@ -25,6 +27,7 @@ class MyS1GRPOTrainer(GRPOTrainer):
         num_ignore=1,               # number of times to ignore the stop token
         temperature_override=0.0,   # example: 0.0 means deterministic
         min_p=0.1,
+        continuation_cue="Wait",    # appended when a rollout stops before min_tokens_thinking
     ):
         super().__init__(
             model=model,
@@ -43,12 +46,15 @@ class MyS1GRPOTrainer(GRPOTrainer):
             self.s1_tokenizer = AutoTokenizer.from_pretrained(model.config._name_or_path, padding_side="left")
             # Example stop tokens. You can customize or remove them:
             stop_token_ids = self.s1_tokenizer("<|im_start|><|im_end|><|endoftext|>")["input_ids"]
+            self.s1_stop_token_ids = stop_token_ids
+            self.s1_cue_token_ids = self.s1_tokenizer(continuation_cue, add_special_tokens=False)["input_ids"]
 
             # Override the parent's sampling_params as you'd like:
             self.sampling_params = SamplingParams(
                 n=self.args.num_generations,
                 max_tokens=max_tokens_thinking,
-                min_tokens=min_tokens_thinking,
+                # With num_ignore, budget forcing below extends early stops instead
+                min_tokens=0 if num_ignore > 0 else min_tokens_thinking,
                 stop_token_ids=stop_token_ids,
                 skip_special_tokens=False,
                 temperature=temperature_override,
@@ -56,41 +62,54 @@ class MyS1GRPOTrainer(GRPOTrainer):
             )
 
             # --- Patch the vLLM generate() method ---
-            # Here we wrap the original generate to ensure that for every prompt, 
-            # we never exceed the model's maximum sequence length
+            # Here we wrap the original generate to ensure that for every prompt,
+            # we never exceed the model's maximum sequence length. All prompts go
+            # to one generate() call with per-prompt max_tokens, so vLLM batches
+            # them together and shares prefixes across num_generations.
             orig_generate = self.llm.generate
             def generate_with_truncation(prompts_text, sampling_params, **kwargs):
-                new_outputs = []
-                for prompt in prompts_text:
-                    # Compute token length of the prompt using our dedicated tokenizer.
-                    # Note: We disable padding and special tokens to get an accurate count.
-                    encoding = self.s1_tokenizer(
-                        prompt,
-                        return_tensors="pt",
-                        padding=False,
-                        add_special_tokens=False,
-                    )
-                    prompt_length = encoding["input_ids"].shape[1]
-                    # Calculate how many tokens are left before reaching the model's max sequence length.
-                    # self.args.vllm_max_model_len is the value passed to the LLM at initialization.
-                    allowed_tokens = self.args.max_completion_length - prompt_length
-                    if allowed_tokens < 1:
-                        raise ValueError(
-                            f"Prompt too long ({prompt_length} tokens); maximum allowed is {self.args.vllm_max_model_len}"
-                        )
-                    # Create new sampling parameters, ensuring we do not request more than 'allowed_tokens'.
-                    new_params = self.sampling_params.clone()
-                    new_params.max_tokens = min(self.sampling_params.max_tokens, allowed_tokens)
-                    # Call the original generate() for this prompt.
-                    result = orig_generate([prompt], sampling_params=new_params, **kwargs)
-                    new_outputs.extend(result)
-                return new_outputs
+                # Token length of every prompt from one batched call to our dedicated tokenizer.
+                # Note: We disable padding and special tokens to get an accurate count.
+                prompt_lengths = self.s1_tokenizer(
+                    list(prompts_text),
+                    padding=False,
+                    add_special_tokens=False,
+                    return_length=True,
+                    return_attention_mask=False,
+                )["length"]
+                outputs = generate_bucketed(
+                    orig_generate,
+                    prompts_text,
+                    self.sampling_params,
+                    prompt_lengths,
+                    self.args.max_completion_length,
+                    **kwargs,
+                )
+                # s1-style budget forcing: rollouts that stop before min_tokens_thinking get
+                # the continuation cue and are resumed from their token ids, up to num_ignore times.
+                force_budget(
+                    orig_generate,
+                    outputs,
+                    self.sampling_params,
+                    self.s1_cue_token_ids,
+                    self.min_tokens_thinking,
+                    self.num_ignore,
+                    self.args.max_completion_length,
+                    self.s1_stop_token_ids,
+                    # Forced completions get their text back the way vLLM detokenizes it
+                    decode=lambda token_ids: self.s1_tokenizer.decode(
+                        token_ids, skip_special_tokens=self.sampling_params.skip_special_tokens
+                    ),
+                    **kwargs,
+                )
+                return outputs
             self.llm.generate = generate_with_truncation
 
         self.num_ignore = num_ignore
+        self.min_tokens_thinking = min_tokens_thinking
 
         """
-        Illustrates partial generation logic like s1 does:
+        Partial generation logic like s1 does (see force_budget):
         1) Generate once with big max_tokens.
         2) Append partial output + 'Wait' a few times to skip the stop token.
         """
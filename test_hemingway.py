@@ -1,6 +1,17 @@
 #!/opt/homebrew/bin/python3.12 -m pytest
 
+import csv
+import io
+import json
+import os
+import pickle
+import random
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import hemingway
 from hemingway import (
     TextAnalysis,
     weak_phrases,
@@ -11,7 +22,23 @@ from hemingway import (
     get_readability_level,
     analyze_sentence,
     analyze_paragraph,
-    analyze_text
+    analyze_text,
+    AnalysisCache,
+    IncrementalAnalyzer,
+    analyze_batch,
+    analyze_corpus,
+    analyze_long_text,
+    analyze_text_fast,
+    calculate_reading_stats_batch,
+    classify_sentence,
+    combine_stats,
+    compile_phrase_trie,
+    find_phrase_occurrences,
+    passive_voices,
+    plan_batch_chunks,
+    shutdown_analysis_pool,
+    split_text_with_offsets,
+    too_wordy
 )
 
 # Test data
@@ -225,5 +252,603 @@ def test_complex_text_analysis():
     # Test reading time
     assert stats["reading_time_in_secs"] > 30  # Should take significant time to read
 
+def _regex_qualifiers(sentence):
+    """The original per-phrase regex scan, kept as a reference for the compiled matcher."""
+    sentence_lower = sentence.lower()
+    found = []
+    for phrase in weak_phrases:
+        if re.search(r'\b' + re.escape(phrase) + r'\b', sentence_lower):
+            found.append(phrase)
+    for phrase in weak_phrases:
+        parts = phrase.split()
+        if len(parts) > 1:
+            pattern = r'\b' + r'\b\s+\w+\s+\b'.join(map(re.escape, parts)) + r'\b'
+            if re.search(pattern, sentence_lower) and phrase not in found:
+                found.append(phrase)
+    return found
+
+def test_qualifier_matcher_matches_regex_scan():
+    """The compiled qualifier index must count exactly what the regex scan counted."""
+    rng = random.Random(1234)
+    fillers = ["really", "truly", "the", "don't", "I", "We", "just", "think", "x1", "_"]
+    separators = [" ", "  ", "\t", ", ", "'", "-", " (", "\n"]
+    sentences = [
+        "I actually believe this sentence is quite complicated.",
+        "I would suggest we think about it.",
+        "I really don't really think so.",
+        "I don't  think so, and we  were wondering.",
+        "Maybe, just maybe, it is kind of odd. Is sort of odd?",
+        "In my humble opinion we will not try.",
+        "Perhaps_not; possiblyy; justice.",
+    ]
+    for _ in range(500):
+        words = []
+        for _ in range(rng.randint(1, 12)):
+            if rng.random() < 0.5:
+                words.extend(rng.choice(list(weak_phrases)).split())
+            else:
+                words.append(rng.choice(fillers))
+        sentence = words[0]
+        for word in words[1:]:
+            sentence += rng.choice(separators) + word
+        sentences.append(sentence + ".")
+
+    for sentence in sentences:
+        expected = _regex_qualifiers(sentence)
+        stats = analyze_sentence(sentence, SAMPLE_SETTINGS)
+        assert stats["highlights"]["qualifiers"] == len(expected), sentence
+
+def test_analysis_cache_hits_and_eviction():
+    """The LRU cache analyzes each unique text once and stays bounded."""
+    cache = AnalysisCache(maxsize=2)
+    first = cache.analyze(SAMPLE_TEXT, SAMPLE_SETTINGS)
+    assert cache.analyze(SAMPLE_TEXT, SAMPLE_SETTINGS) is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+    assert first.stats == analyze_text_fast(SAMPLE_TEXT, SAMPLE_SETTINGS).stats
+
+    # Settings are part of the key
+    cache.analyze(SAMPLE_TEXT, {"reading_level_target": "TECHNICAL"})
+    assert cache.misses == 2
+
+    # Oldest entry is evicted once maxsize is exceeded
+    cache.analyze(COMPLEX_TEXT, SAMPLE_SETTINGS)
+    assert cache.stats()["size"] == 2
+    assert cache.analyze(SAMPLE_TEXT, SAMPLE_SETTINGS) is not first
+    assert cache.misses == 4
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+
+def test_analysis_cache_threads_and_pickling():
+    """The cache can be shared by threads and copied into other processes."""
+    cache = AnalysisCache(maxsize=8)
+    texts = [SAMPLE_TEXT, COMPLEX_TEXT, COMPLEX_TEXT_2] * 20
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda text: cache.analyze(text, SAMPLE_SETTINGS), texts))
+    assert cache.hits + cache.misses == len(texts)
+    assert cache.stats()["size"] == 3
+    assert [r.stats.words for r in results[:3]] == [r.stats.words for r in results[3:6]]
+
+    clone = pickle.loads(pickle.dumps(cache))
+    assert clone.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 8}
+
+def test_analyze_text_tree():
+    """The paragraph/sentence tree agrees with the totals and with re-analysis."""
+    result = analyze_text(COMPLEX_TEXT_2, SAMPLE_SETTINGS, include_tree=True)
+    stats = result.stats
+    tree = result.paragraph_stats
+
+    assert analyze_text(COMPLEX_TEXT_2, SAMPLE_SETTINGS).paragraph_stats is None
+    assert len(tree) == stats.paragraphs == len(result.paragraphs)
+    assert sum(p.sentences for p in tree) == stats.sentences
+    assert sum(p.words for p in tree) == stats.words
+    assert sum(p.highlights.adverbs for p in tree) == stats.highlights.adverbs
+
+    for paragraph, paragraph_stats in zip(result.paragraphs, tree):
+        assert len(paragraph_stats.sentence_stats) == paragraph_stats.sentences
+        assert sum(s.letters for s in paragraph_stats.sentence_stats) == paragraph_stats.letters
+        assert analyze_text(paragraph, SAMPLE_SETTINGS).stats.sentences == paragraph_stats.sentences
+
+def test_analyze_text_fast():
+    """The slotted result matches the pydantic one and does not keep the text."""
+    for text in (SAMPLE_TEXT, COMPLEX_TEXT, COMPLEX_TEXT_2, ""):
+        fast = analyze_text_fast(text, SAMPLE_SETTINGS, include_tree=True)
+        model = analyze_text(text, SAMPLE_SETTINGS, include_tree=True)
+        assert fast.to_model(text) == model
+        assert fast["stats"]["highlights"]["adverbs"] == model["stats"]["highlights"]["adverbs"]
+        assert fast["stats"]["reading_level"] == model.stats.reading_level
+
+    fast = analyze_text_fast(SAMPLE_TEXT, SAMPLE_SETTINGS)
+    assert fast.paragraph_stats is None
+    assert not hasattr(fast, "text")
+    assert not hasattr(fast, "__dict__")
+    assert not hasattr(fast.stats, "__dict__")
+
+def test_plan_batch_chunks():
+    """Short texts are grouped, long texts stand alone, and every index is covered once."""
+    texts = ["short."] * 50 + ["x" * 100_000] + ["short."] * 50
+    chunks = plan_batch_chunks(texts, workers=4)
+    assert [i for chunk in chunks for i in chunk] == list(range(len(texts)))
+    assert range(50, 51) in chunks
+    assert len(chunks) < len(texts)
+
+def test_analyze_batch():
+    """Pool and in-process paths return the serial results in input order."""
+    texts = [COMPLEX_TEXT, SAMPLE_TEXT, "", COMPLEX_TEXT_2] * 10
+    expected = [analyze_text_fast(text, SAMPLE_SETTINGS, include_tree=True) for text in texts]
+    assert sum(len(text) for text in texts) >= hemingway.BATCH_MIN_PARALLEL_CHARS
+    try:
+        assert analyze_batch(texts, SAMPLE_SETTINGS, workers=2, include_tree=True) == expected
+        # The pool persists between calls
+        pool = hemingway.get_analysis_pool(2)
+        assert analyze_batch(texts[::-1], SAMPLE_SETTINGS, workers=2, include_tree=True) == expected[::-1]
+        assert hemingway.get_analysis_pool(2) is pool
+    finally:
+        shutdown_analysis_pool()
+
+    # Tiny batches never start a pool
+    assert analyze_batch(texts[:2], SAMPLE_SETTINGS, workers=2, include_tree=True) == expected[:2]
+    assert hemingway._pools == {}
+
+def test_analysis_pools_per_worker_count():
+    """Callers asking for different worker counts never cancel each other's work."""
+    texts = [COMPLEX_TEXT, COMPLEX_TEXT_2] * 20
+    expected = [analyze_text_fast(text, SAMPLE_SETTINGS) for text in texts]
+    try:
+        with ThreadPoolExecutor(max_workers=4) as threads:
+            futures = [threads.submit(analyze_batch, texts, SAMPLE_SETTINGS, workers) for workers in (2, 3, 2, 3)]
+            assert [future.result() for future in futures] == [expected] * 4
+        assert sorted(hemingway._pools) == [2, 3]
+    finally:
+        shutdown_analysis_pool()
+    assert hemingway._pools == {}
+    start_method = hemingway.get_pool_context().get_start_method()
+    assert (start_method == "fork") == sys.platform.startswith("linux")
+
+def test_incremental_analyzer_matches_analyze_text():
+    """Every snapshot equals a full analysis of the text fed so far."""
+    rng = random.Random(42)
+    pieces = ["word", " ", "  ", ".", "!", "?", "\n", "\n\n", "I think", "just", " . "]
+    texts = [SAMPLE_TEXT, COMPLEX_TEXT, COMPLEX_TEXT_2, "", "\n\nLeading break.", "Trailing break.\n\n\n"]
+    texts += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 30))) for _ in range(200)]
+
+    for text in texts:
+        analyzer = IncrementalAnalyzer(SAMPLE_SETTINGS)
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 12)
+            analyzer.feed(text[position:position + size])
+            position += size
+            assert analyzer.snapshot() == analyze_text_fast(text[:position], SAMPLE_SETTINGS).stats, text[:position]
+        assert analyzer.snapshot() == analyze_text_fast(text, SAMPLE_SETTINGS).stats
+
+def test_incremental_analyzer_keeps_only_unfinished_sentence():
+    """Finished sentences and paragraphs are not re-processed."""
+    analyzer = IncrementalAnalyzer(SAMPLE_SETTINGS)
+    analyzer.feed("First paragraph here. It has two sentences.\n\nSecond one starts")
+    assert analyzer._tail == "Second one starts"
+    analyzer.feed(" and ends. Third")
+    assert analyzer._tail == "Third"
+    assert analyzer.snapshot().sentences == 4
+    assert analyzer.snapshot().paragraphs == 2
+
+def test_calculate_reading_stats_batch():
+    """The vectorized path agrees with the scalar functions, including edge cases."""
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    words = rng.integers(0, 400, size=5000)
+    letters = words * rng.integers(0, 12, size=5000)
+    sentences = rng.integers(0, 30, size=5000)
+    # Zero letters, zero words and zero sentences
+    letters[:3], words[:3], sentences[:3] = [0, 0, 0], [43, 0, 20], [1, 5, 0]
+
+    for target in ("ACCESSIBLE", "NORMAL", "TECHNICAL", "UNKNOWN"):
+        settings = {"reading_level_target": target}
+        levels, readability, seconds = calculate_reading_stats_batch(letters, words, sentences, settings)
+        for i in range(len(words)):
+            counts = {"letters": int(letters[i]), "words": int(words[i]), "sentences": int(sentences[i])}
+            level = calculate_reading_level(counts)
+            assert levels[i] == level
+            assert readability[i] == get_readability_level(level, settings, counts["words"])
+            assert seconds[i] == counts["words"] / 250 * 60
+
+def test_hard_sentences():
+    """Sentences are classified with the readability thresholds during analysis."""
+    simple = analyze_sentence("The dog ran home.", SAMPLE_SETTINGS)
+    assert simple["highlights"]["hard_sentences"] == 0
+    assert simple["highlights"]["very_hard_sentences"] == 0
+
+    hard = analyze_sentence(
+        "The committee reviewed the proposal carefully and decided that the budget needed another revision before approval.",
+        SAMPLE_SETTINGS
+    )
+    assert hard["highlights"]["hard_sentences"] + hard["highlights"]["very_hard_sentences"] == 1
+    assert classify_sentence(hard["letters"], hard["words"], SAMPLE_SETTINGS) in ("hard", "very_hard")
+    # Too few words is never hard, whatever the word length
+    assert classify_sentence(200, 10, SAMPLE_SETTINGS) == "normal"
+
+    result = analyze_text(COMPLEX_TEXT, SAMPLE_SETTINGS, include_tree=True)
+    highlights = result.stats.highlights
+    assert highlights.very_hard_sentences >= 5
+    assert highlights.hard_sentences + highlights.very_hard_sentences <= result.stats.sentences
+    sentences = [s for p in result.paragraph_stats for s in p.sentence_stats]
+    for sentence in sentences:
+        readability = classify_sentence(sentence.letters, sentence.words, SAMPLE_SETTINGS)
+        assert sentence.highlights.hard_sentences == (readability == "hard")
+        assert sentence.highlights.very_hard_sentences == (readability == "very_hard")
+
+def test_sentence_difficulty_is_shared(monkeypatch):
+    """Every analysis path classifies sentences through sentence_difficulty."""
+    import hemingway
+    monkeypatch.setattr(hemingway, "sentence_difficulty", lambda letters, words, level_settings: 2)
+    long_sentence = "The committee reviewed the proposal carefully and decided that the budget needed another revision before approval."
+    assert analyze_sentence(long_sentence, SAMPLE_SETTINGS)["highlights"]["very_hard_sentences"] == 1
+    assert analyze_text_fast(long_sentence, SAMPLE_SETTINGS).stats.highlights.very_hard_sentences == 1
+    assert classify_sentence(10, 1, SAMPLE_SETTINGS) == "very_hard"
+
+def test_find_phrase_occurrences():
+    """The phrase trie finds leftmost-longest, whitespace-separated matches."""
+    trie = compile_phrase_trie(["a number of", "number", "in some instances ", "of"])
+    sentence = "a number of cases, a number, in some  instances of,of."
+    pieces = re.split(r"(\w+)", sentence)
+    words, separators = pieces[1::2], pieces[0:-1:2]
+    found = [(words[start], words[end - 1], phrase) for start, end, phrase in find_phrase_occurrences(words, separators, trie)]
+    assert found == [
+        ("a", "of", "a number of"),
+        ("number", "number", "number"),
+        ("in", "instances", "in some instances"),
+        ("of", "of", "of"),
+        ("of", "of", "of"),
+    ]
+
+def test_complex_words():
+    """Wordy phrases from too_wordy are counted with their suggested replacements."""
+    stats = analyze_sentence("We utilize a number of tools in order to facilitate   the work.", SAMPLE_SETTINGS)
+    highlights = stats["highlights"]
+    assert highlights["complex_words"] == 4
+    assert highlights["complex_word_counts"] == {"utilize": 1, "a number of": 1, "in order to": 1, "facilitate": 1}
+
+    result = analyze_text(COMPLEX_TEXT, SAMPLE_SETTINGS)
+    highlights = result.stats.highlights
+    assert highlights.complex_words == sum(highlights.complex_word_counts.values())
+    assert highlights.complex_word_counts["aforementioned"] == 2
+    assert highlights.complex_word_suggestions["utilize"] == too_wordy["utilize"]
+    assert set(highlights.complex_word_suggestions) == set(highlights.complex_word_counts)
+
+    fast = analyze_text_fast(COMPLEX_TEXT, SAMPLE_SETTINGS)
+    assert fast.stats.highlights.complex_word_suggestions == highlights.complex_word_suggestions
+
+def test_split_text_with_offsets():
+    """Offsets locate the same substrings split_text returns."""
+    for text in (SAMPLE_TEXT, COMPLEX_TEXT_2, "\n\nA. B!  C\n\n\n  \n\nD", ""):
+        for delimiter_type in ("paragraph", "sentence"):
+            pairs = split_text_with_offsets(text, delimiter_type)
+            assert [piece for _, piece in pairs] == split_text(text, delimiter_type)
+            for offset, piece in pairs:
+                # Only a period appended by split_text may differ from the text
+                core = piece if text.startswith(piece, offset) else piece[:-1]
+                assert text.startswith(core, offset)
+
+def test_highlight_spans():
+    """Spans point at the highlighted words and agree with the counts."""
+    text = COMPLEX_TEXT + "\n\nThe İstanbul report was written quickly. Actually, I just think so."
+    result = analyze_text_fast(text, SAMPLE_SETTINGS, include_spans=True)
+    assert analyze_text_fast(text, SAMPLE_SETTINGS).spans is None
+    assert result.spans.typecode == "I"
+
+    spans = list(result.iter_spans())
+    assert len(result.spans) == 3 * len(spans)
+    kinds = [kind for _, _, kind in spans]
+    highlights = result.stats.highlights
+    assert kinds.count("adverb") == highlights.adverbs
+    assert kinds.count("qualifier") == highlights.qualifiers
+    assert kinds.count("passive_voice") == highlights.passive_voices
+    assert kinds.count("complex_word") == highlights.complex_words
+    assert kinds.count("hard_sentence") == highlights.hard_sentences
+    assert kinds.count("very_hard_sentence") == highlights.very_hard_sentences
+
+    for start, end, kind in spans:
+        found = text[start:end].lower()
+        if kind == "adverb":
+            assert found in adverbs_list
+        elif kind == "passive_voice":
+            assert found in passive_voices
+        elif kind == "complex_word":
+            assert " ".join(found.split()) in hemingway.WORDY_SUGGESTIONS
+    assert (text.index("written"), text.index("written") + len("written"), "passive_voice") in spans
+    assert (text.index("I just think"), text.index("I just think") + len("I just think"), "qualifier") in spans
+
+def test_combine_stats_is_associative():
+    """Paragraph counts merge in any grouping, with _empty_stats() as identity."""
+    a, b, c = [hemingway.analyze_paragraph(text, SAMPLE_SETTINGS) for text in (SAMPLE_TEXT, COMPLEX_TEXT, COMPLEX_TEXT_2)]
+    left = combine_stats(combine_stats(a, b), c)
+    right = combine_stats(a, combine_stats(b, c))
+    assert left == right
+    assert combine_stats(hemingway._empty_stats(), a) == combine_stats(a, hemingway._empty_stats())
+    assert left["words"] == a["words"] + b["words"] + c["words"]
+    # Inputs are left untouched
+    assert a == hemingway.analyze_paragraph(SAMPLE_TEXT, SAMPLE_SETTINGS)
+
+def test_analyze_long_text_matches_serial(monkeypatch):
+    """Chunked pool analysis gives exactly the serial result."""
+    text = "\n\n\n".join([COMPLEX_TEXT, SAMPLE_TEXT, "\n", COMPLEX_TEXT_2] * 40)
+    monkeypatch.setattr(hemingway, "LONG_TEXT_MIN_CHUNK_CHARS", 500)
+    chunks = hemingway.plan_text_chunks(text, 2_000)
+    assert len(chunks) > 10
+    assert "".join(text[chunk.start:chunk.stop] for chunk in chunks) == text
+    assert [paragraph for chunk in chunks for paragraph in split_text(text[chunk.start:chunk.stop], "paragraph")] \
+        == split_text(text, "paragraph")
+
+    expected = analyze_text_fast(text, SAMPLE_SETTINGS, include_tree=True, include_spans=True)
+    try:
+        result = analyze_long_text(text, SAMPLE_SETTINGS, workers=2, include_tree=True, include_spans=True)
+    finally:
+        shutdown_analysis_pool()
+    assert result == expected
+    assert result.to_model(text).model_dump_json() == expected.to_model(text).model_dump_json()
+
+    # Short texts stay in process
+    assert analyze_long_text(SAMPLE_TEXT, SAMPLE_SETTINGS, workers=2) == analyze_text_fast(SAMPLE_TEXT, SAMPLE_SETTINGS)
+    assert hemingway._pools == {}
+
+def test_cli_streams_files_and_jsonl(tmp_path, capsys):
+    """The CLI writes one row per document, in input order."""
+    texts = [COMPLEX_TEXT, SAMPLE_TEXT, "", COMPLEX_TEXT_2] * 30
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "b.txt").write_text(COMPLEX_TEXT_2)
+    (tmp_path / "docs" / "a.txt").write_text(SAMPLE_TEXT)
+    (tmp_path / "docs" / "skip.md").write_text(COMPLEX_TEXT)
+    with open(tmp_path / "rollouts.jsonl", "w") as f:
+        for text in texts:
+            f.write(json.dumps({"completion": text}) + "\n")
+
+    settings = {"reading_level_target": "TECHNICAL"}
+    try:
+        assert hemingway.main([
+            str(tmp_path / "rollouts.jsonl"), "--field", "completion", "-j", "2", "-q",
+            "--settings", json.dumps(settings), "-o", str(tmp_path / "out.jsonl"),
+        ]) == 0
+    finally:
+        shutdown_analysis_pool()
+    with open(tmp_path / "out.jsonl") as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["source"] for row in rows] == [f"{tmp_path / 'rollouts.jsonl'}:{i}" for i in range(1, len(texts) + 1)]
+    for row, text in zip(rows, texts):
+        stats = analyze_text_fast(text, settings).stats
+        assert row["reading_level"] == stats.reading_level
+        assert row["qualifiers"] == stats.highlights.qualifiers
+
+    assert hemingway.main([str(tmp_path / "docs"), "-f", "csv", "-j", "1"]) == 0
+    captured = capsys.readouterr()
+    rows = list(csv.DictReader(io.StringIO(captured.out)))
+    assert [os.path.basename(row["source"]) for row in rows] == ["a.txt", "b.txt"]
+    assert int(rows[1]["words"]) == analyze_text_fast(COMPLEX_TEXT_2, SAMPLE_SETTINGS).stats.words
+    assert "2 docs" in captured.err
+
+    with pytest.raises(SystemExit):
+        hemingway.main(["--settings", '{"reading_level_target": "EASY"}'])
+
+def test_cli_reports_bad_input(tmp_path, capsys):
+    """A malformed JSONL line or a missing file stops the run with its location and exit status 1."""
+    (tmp_path / "good.jsonl").write_text('{"text": "One."}\n{"text": "Two."}\n')
+    (tmp_path / "bad.jsonl").write_text('{"text": "One."}\n{"text": \n')
+    (tmp_path / "field.jsonl").write_text('{"body": "One."}\n')
+    cases = [
+        ("bad.jsonl", f"{tmp_path / 'bad.jsonl'}:2: invalid JSON"),
+        ("field.jsonl", f"{tmp_path / 'field.jsonl'}:1: no string field 'text'"),
+        ("missing.txt", "missing.txt"),
+    ]
+    for workers in ("1", "2"):
+        for name, message in cases:
+            with pytest.raises(SystemExit) as exit_info:
+                hemingway.main([str(tmp_path / "good.jsonl"), str(tmp_path / name), "-j", workers, "-q"])
+            assert exit_info.value.code == 1
+            err = capsys.readouterr().err
+            assert message in err and "Traceback" not in err
+    shutdown_analysis_pool()
+
+def test_cli_corpus_expands_directories(tmp_path, capsys):
+    """--corpus analyzes each file matching --glob as one document and rejects standard input."""
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "b.txt").write_text(COMPLEX_TEXT_2)
+    (tmp_path / "docs" / "sub" / "a.txt").write_text(SAMPLE_TEXT)
+    (tmp_path / "docs" / "skip.md").write_text(COMPLEX_TEXT)
+    assert hemingway.main([str(tmp_path / "docs"), "--corpus", "-j", "1", "-q"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [os.path.relpath(row["source"], tmp_path / "docs") for row in rows] == ["b.txt", os.path.join("sub", "a.txt")]
+    assert rows[0]["words"] == analyze_text_fast(COMPLEX_TEXT_2, SAMPLE_SETTINGS).stats.words
+
+    for argv in (["--corpus"], ["--corpus", str(tmp_path / "docs" / "b.txt"), "-"]):
+        with pytest.raises(SystemExit):
+            hemingway.main(argv)
+    assert "cannot read standard input" in capsys.readouterr().err
+
+def test_analyze_corpus_matches_analyze_text(tmp_path):
+    """Memory-mapped windows give the stats of the whole file read as one text."""
+    rng = random.Random(7)
+    pieces = ["word", " ", ".", "\n", "\n\n", "\n\n\n", "I think", "very", "caf\u00e9", "\u0130"]
+    path = tmp_path / "corpus.txt"
+    for _ in range(200):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 60)))
+        path.write_bytes(text.encode("utf-8"))
+        expected = analyze_text_fast(text, SAMPLE_SETTINGS).stats
+        assert analyze_corpus(str(path), SAMPLE_SETTINGS, window_bytes=rng.randint(1, 24)) == expected
+
+    text = "\n\n".join([COMPLEX_TEXT, SAMPLE_TEXT, COMPLEX_TEXT_2] * 50)
+    path.write_bytes(text.encode("utf-8"))
+    windows = list(hemingway.iter_corpus_windows(path.read_bytes(), 4_000))
+    assert len(windows) > 10
+    expected = analyze_text_fast(text, SAMPLE_SETTINGS).stats
+    try:
+        assert analyze_corpus(str(path), SAMPLE_SETTINGS, workers=2, window_bytes=4_000) == expected
+    finally:
+        shutdown_analysis_pool()
+
+IMPORT_TIME_BUDGET_US = 150_000  # pydantic alone takes longer than this
+
+def test_import_is_lean():
+    """Importing hemingway loads neither pydantic nor the pool or CLI modules."""
+    import subprocess
+    import sys
+    heavy = ("pydantic", "multiprocessing", "concurrent.futures", "argparse", "json")
+    code = f"import sys, hemingway; print([m for m in {heavy!r} if m in sys.modules])"
+    cwd = os.path.dirname(os.path.abspath(hemingway.__file__))
+    timings = []
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, check=True, cwd=cwd
+        )
+        assert result.stdout.strip() == "[]"
+        line = [line for line in result.stderr.splitlines() if line.endswith("| hemingway")][0]
+        timings.append(int(line.split("|")[1]))
+    assert min(timings) < IMPORT_TIME_BUDGET_US
+
+    # Models still resolve from the module, on demand
+    assert hemingway.TextAnalysis.__module__ == "hemingway_models"
+    with pytest.raises(AttributeError):
+        hemingway.NotAModel
+
+def test_word_class_table_and_custom_lexicons(tmp_path):
+    """One table classifies words for every lexicon; lexicon files extend it via settings."""
+    classes = hemingway.DEFAULT_LEXICONS.word_classes
+    assert classes["actually"] & hemingway.WORD_ADVERB
+    assert classes["beaten"] & hemingway.WORD_PASSIVE_VOICE
+    assert classes["i"] & hemingway.WORD_QUALIFIER_START
+    assert classes["utilize"] & hemingway.WORD_COMPLEX_START
+    assert "dog" not in classes
+
+    adverbs = tmp_path / "adverbs.txt"
+    adverbs.write_text("# house style\nswiftly\n\nBriskly\n")
+    wordy = tmp_path / "wordy.txt"
+    wordy.write_text("at the end of the day\n")
+    settings = {**SAMPLE_SETTINGS, "lexicons": {"adverbs": str(adverbs), "complex_words": [str(wordy)]}}
+    assert hemingway.load_lexicon(str(adverbs)) == ["swiftly", "briskly"]
+
+    sentence = "He ran swiftly and briskly, at the end of the day he was actually beaten."
+    default = analyze_sentence(sentence, SAMPLE_SETTINGS)["highlights"]
+    custom = analyze_sentence(sentence, settings)["highlights"]
+    assert custom["adverbs"] == default["adverbs"] + 2
+    assert custom["complex_word_counts"] == {"at the end of the day": 1}
+    assert custom["passive_voices"] == default["passive_voices"]
+    assert hemingway.get_lexicons(settings) is hemingway.get_lexicons(dict(settings))
+
+    analysis = analyze_text_fast(sentence, settings)
+    assert analysis.stats.highlights.complex_word_suggestions == {"at the end of the day": []}
+    # Settings with different lexicons are cached separately
+    cache = AnalysisCache()
+    assert cache.analyze(sentence, settings).stats.highlights.adverbs == custom["adverbs"]
+    assert cache.analyze(sentence, SAMPLE_SETTINGS).stats.highlights.adverbs == default["adverbs"]
+
+    with pytest.raises(ValueError):
+        hemingway.get_lexicons({"lexicons": {"verbs": str(adverbs)}})
+
+def test_tokenize_document_matches_split_text():
+    """Sentence ranges reproduce split_text, and the single-pass analysis the per-sentence one."""
+    rng = random.Random(11)
+    pieces = ["word", "I", " ", "  ", ".", "!?", "\n", "\n\n", "\n\n\n", "\t", " . ", "I think",
+              "we would suggest", "a number of", "actually", "beaten", "\u00dcn\u00ef", "\u0130", "\u03a3\u039f"]
+    texts = [SAMPLE_TEXT, COMPLEX_TEXT, COMPLEX_TEXT_2, ""]
+    texts += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 40))) for _ in range(2000)]
+    for text in texts:
+        paragraphs = hemingway.tokenize_document(text)
+        assert [[text[start:end] + "." for start, end in sentences] for _, _, sentences in paragraphs] \
+            == [split_text(paragraph, "sentence") for paragraph in split_text(text, "paragraph")]
+        for include_tree in (False, True):
+            totals, tree = hemingway._analyze_paragraphs(
+                split_text_with_offsets(text, "paragraph"), SAMPLE_SETTINGS, include_tree
+            )
+            expected = hemingway.FastTextAnalysis(hemingway._text_stats(totals, SAMPLE_SETTINGS), tree)
+            assert analyze_text_fast(text, SAMPLE_SETTINGS, include_tree) == expected
+
+def test_profile_stages():
+    """Stage timings are recorded only inside profile_stages and leave results unchanged."""
+    expected = analyze_text(COMPLEX_TEXT, SAMPLE_SETTINGS)
+    assert hemingway._profiler is None
+    with hemingway.profile_stages() as profiler:
+        assert analyze_text(COMPLEX_TEXT, SAMPLE_SETTINGS) == expected
+        # Spans take the per-sentence path, which is instrumented too
+        analyze_text_fast(SAMPLE_TEXT, SAMPLE_SETTINGS, include_spans=True)
+    assert hemingway._profiler is None
+
+    stats = profiler.as_dict()
+    for stage in hemingway.PROFILE_STAGES:
+        assert stats[f"{stage}.calls"] > 0
+        assert stats[f"{stage}.seconds"] >= 0
+    assert stats["documents"] == 2
+    assert stats["words"] == expected.stats.words + analyze_text_fast(SAMPLE_TEXT, SAMPLE_SETTINGS).stats.words
+    assert stats["lexicon_match.calls"] == stats["sentences"]
+
+    analyze_text(COMPLEX_TEXT, SAMPLE_SETTINGS)
+    assert profiler.as_dict() == stats
+    profiler.reset()
+    assert not any(profiler.as_dict().values())
+
+def test_async_analysis(monkeypatch):
+    """Coroutines return results in request order and respect the in-flight limit."""
+    import asyncio
+    import threading
+    import time
+
+    texts = [COMPLEX_TEXT, SAMPLE_TEXT, "", COMPLEX_TEXT_2] * 6
+    expected = [analyze_text_fast(text, SAMPLE_SETTINGS) for text in texts]
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    real_analyze = hemingway.analyze_text_fast
+
+    def slow_analyze(text, parser_settings, include_tree=False):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.002)
+        with lock:
+            active -= 1
+        return real_analyze(text, parser_settings, include_tree)
+
+    async def score_threads():
+        analyzer = hemingway.AsyncAnalyzer("thread", workers=4, max_in_flight=2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        try:
+            results = await asyncio.gather(*(analyzer.analyze(text, SAMPLE_SETTINGS) for text in texts))
+        finally:
+            task.cancel()
+            analyzer.shutdown()
+        return results, ticks
+
+    monkeypatch.setattr(hemingway, "analyze_text_fast", slow_analyze)
+    results, ticks = asyncio.run(score_threads())
+    monkeypatch.setattr(hemingway, "analyze_text_fast", real_analyze)
+    assert results == expected
+    assert peak <= 2
+    assert ticks > len(texts)  # the loop kept running while texts were analyzed
+
+    async def score_processes():
+        hemingway.configure_async_analysis("process", workers=2)
+        batch = await hemingway.analyze_batch_async(texts, SAMPLE_SETTINGS, include_tree=True)
+        single = await hemingway.analyze_text_async(COMPLEX_TEXT, SAMPLE_SETTINGS)
+        return batch, single
+
+    try:
+        batch, single = asyncio.run(score_processes())
+    finally:
+        shutdown_analysis_pool()
+        hemingway._async_analyzer = None
+    assert batch == [analyze_text_fast(text, SAMPLE_SETTINGS, include_tree=True) for text in texts]
+    assert single == expected[0]
+
+    with pytest.raises(ValueError):
+        hemingway.AsyncAnalyzer("fiber")
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,181 @@
+#!/opt/homebrew/bin/python3.12 -m pytest
+
+import json
+import random
+
+import pytest
+import hemingway_rewards
+from hemingway import analyze_text_fast, analyze_text_outline
+from hemingway_rewards import (
+    REWARD_NAMES,
+    REWARD_SETTINGS,
+    RewardTable,
+    active_voice_reward,
+    conciseness_reward,
+    paragraph_structure_reward,
+    readability_reward,
+    reward_features,
+    score_text,
+    token_length_reward,
+    tokenizer_token_counter,
+)
+from test_hemingway import COMPLEX_TEXT, COMPLEX_TEXT_2, SAMPLE_TEXT
+
+TEXTS = [
+    SAMPLE_TEXT,
+    COMPLEX_TEXT,
+    COMPLEX_TEXT_2,
+    "",
+    "One line.\n\n\nTwo. Three! Four?",
+    "ΣΣ capital sigma falls back. It was beaten.\n\nStill counted.",
+]
+
+def completions_for(texts):
+    return [[{"role": "assistant", "content": text}] for text in texts]
+
+def test_analyze_text_outline_matches_tree():
+    rng = random.Random(3)
+    pieces = ["Word", "word.", " ", "\n", "\n\n", "It was beaten", "!", "?", "Σ", "very"]
+    texts = TEXTS + ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 40))) for _ in range(300)]
+    for text in texts:
+        stats, counts = analyze_text_outline(text, REWARD_SETTINGS)
+        full = analyze_text_fast(text, REWARD_SETTINGS, include_tree=True)
+        assert stats == full.stats
+        assert counts == [paragraph.sentences for paragraph in full.paragraph_stats]
+
+def test_reward_features_match_analysis():
+    rng = random.Random(5)
+    pieces = ["Word", "was", "beaten", "done.", " ", "\n", "\n\n", "İ", "é", "!", "?", "Σ", "_9"]
+    texts = TEXTS + ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 40))) for _ in range(500)]
+    for text in texts:
+        full = analyze_text_fast(text, REWARD_SETTINGS, include_tree=True)
+        stats = full.stats
+        assert reward_features(text) == (
+            stats.letters, stats.words, stats.sentences, stats.highlights.passive_voices,
+            [paragraph.sentences for paragraph in full.paragraph_stats],
+        ), text
+
+def test_reward_rules():
+    assert readability_reward(8, "normal") == 0.5
+    assert readability_reward(11, "hard") == 0.0
+    assert readability_reward(14, "very_hard") == pytest.approx(-0.7)
+
+    for words, expected in [(30, 0.3), (40, 0.3), (44, -0.3), (50, 0.0), (52, -0.6)]:
+        assert conciseness_reward(words, 2) == expected
+    assert conciseness_reward(16, 0) == 0.3
+
+    assert active_voice_reward(0) == 0.5
+    assert active_voice_reward(3) == pytest.approx(-0.3)
+
+    assert token_length_reward(250) == 0.5
+    assert paragraph_structure_reward([]) == 0.0
+    assert paragraph_structure_reward([3]) == 0.5
+    assert paragraph_structure_reward([1, 4]) == pytest.approx(0.4)
+    assert paragraph_structure_reward([3, 4, 4]) == 0.5  # capped
+    assert paragraph_structure_reward([5, 2, 6, 9]) == pytest.approx(-0.55)
+
+def test_reward_table_views(monkeypatch):
+    calls = []
+    scanned = []
+    real_features = hemingway_rewards.reward_features
+    monkeypatch.setattr(hemingway_rewards, "reward_features", lambda text: scanned.append(text) or real_features(text))
+
+    def count_tokens(texts):
+        calls.append(len(texts))
+        return [len(text.split()) for text in texts]
+
+    table = RewardTable(count_tokens)
+    funcs = table.reward_funcs()
+    assert [func.__name__ for func in funcs] == [f"{name}_reward_func" for name in REWARD_NAMES]
+
+    completions = completions_for(TEXTS)
+    columns = [func(completions, prompts=None) for func in funcs]
+    assert scanned == [text for text in TEXTS if text]  # one scan per completion
+    assert calls == [len(TEXTS)]  # one batched token count per step
+
+    expected = [score_text(text, len(text.split())) for text in TEXTS]
+    assert columns == [list(column) for column in zip(*expected)]
+    assert score_text("") == (0.0,) * 5
+
+    funcs[0](completions_for(TEXTS[:2]))  # a new step is scored afresh
+    assert calls == [len(TEXTS), 2]
+    assert RewardTable().score(completions_for([SAMPLE_TEXT]))["token_length"] == [0.0]
+
+def test_token_counts_from_completion_ids_or_one_batched_call():
+    class FakeTokenizer:
+        def __init__(self):
+            self.calls = []
+
+        def __call__(self, texts, return_length=False, return_attention_mask=True):
+            self.calls.append((list(texts), return_length, return_attention_mask))
+            return {"input_ids": [text.split() for text in texts], "length": [len(text.split()) for text in texts]}
+
+    tokenizer = FakeTokenizer()
+    table = RewardTable(tokenizer_token_counter(tokenizer))
+    token_length = table.reward_funcs()[REWARD_NAMES.index("token_length")]
+    texts = ["one two three", "", "four five"]
+    assert token_length(completions_for(texts)) == [3 / 500, 0.0, 2 / 500]
+    assert tokenizer.calls == [(texts, True, False)]
+
+    completion_ids = [[1] * 500, [], list(range(1000))]
+    table.clear()
+    assert token_length(completions_for(texts), completion_ids=completion_ids) == [1.0, 0.0, 2.0]
+    assert len(tokenizer.calls) == 1  # the trainer's ids need no tokenizer
+
+REWARDS_IMPORT_BUDGET_SECS = 0.25  # the tokenizer download and model load took minutes
+REWARDS_IMPORT_BUDGET_BYTES = 8 << 20  # about 3 MB measured, lexicon tables included
+
+@pytest.mark.parametrize("module", ["hemingway_rewards", "hemingway_prompts", "train_hemingway"])
+def test_import_is_side_effect_free(module):
+    """The reward library and the training script import without the training stack."""
+    import os
+    import subprocess
+    import sys
+    heavy = ("transformers", "datasets", "torch", "unsloth", "trl", "vllm", "peft", "wandb", "pydantic")
+    # Time and memory are measured in separate fresh interpreters: tracing
+    # allocations slows the import several times over.
+    timed = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "secs = time.perf_counter() - start\n"
+        f"print(json.dumps([secs, [m for m in {heavy!r} if m in sys.modules]]))\n"
+    )
+    traced = (
+        "import tracemalloc\n"
+        "tracemalloc.start()\n"
+        f"import {module}\n"
+        "print(tracemalloc.get_traced_memory()[1])\n"
+    )
+    cwd = os.path.dirname(os.path.abspath(hemingway_rewards.__file__))
+
+    def run(code):
+        return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=cwd).stdout
+
+    results = [json.loads(run(timed)) for _ in range(3)]
+    assert all(loaded == [] for _, loaded in results)
+    assert min(secs for secs, _ in results) < REWARDS_IMPORT_BUDGET_SECS
+    peak = int(run(traced))
+    assert 0 < peak < REWARDS_IMPORT_BUDGET_BYTES  # the whole import chain is traced
+
+def test_reward_tokenizer_loads_lazily(monkeypatch):
+    loaded = []
+
+    class FakeTokenizer:
+        def __call__(self, texts, return_length=False, return_attention_mask=True):
+            return {"length": [len(text) for text in texts]}
+
+    monkeypatch.setattr(hemingway_rewards, "_tokenizer", None)
+    monkeypatch.setattr(hemingway_rewards, "get_reward_tokenizer",
+                        lambda: loaded.append(1) or FakeTokenizer())
+    hemingway_rewards.reward_table.clear()
+    completions = completions_for(["abcd"])
+    assert hemingway_rewards.token_length_reward_func(completions, completion_ids=[[1, 2]]) == [2 / 500]
+    assert loaded == []  # the trainer's ids need no tokenizer
+    hemingway_rewards.reward_table.clear()
+    assert hemingway_rewards.token_length_reward_func(completions) == [4 / 500]
+    assert loaded == [1]
+    hemingway_rewards.reward_table.clear()
+
+if __name__ == "__main__":
+    pytest.main([__file__])
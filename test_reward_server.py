@@ -0,0 +1,197 @@
+#!/opt/homebrew/bin/python3.12 -m pytest
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from reward_server import RewardBatcher, RewardClient, load_reward_funcs, score_completions, serve
+
+def length_reward_func(completions, **kwargs) -> list[float]:
+    return [len(completion[0]["content"]) / 10 for completion in completions]
+
+def word_reward_func(completions, **kwargs) -> list[float]:
+    return [len(completion[0]["content"].split()) for completion in completions]
+
+def slow_reward_func(completions, **kwargs) -> list[float]:
+    time.sleep(0.05)
+    return [1.0] * len(completions)
+
+def ids_reward_func(completions, completion_ids=None, **kwargs) -> list[float]:
+    if completion_ids is None:
+        return [-1.0] * len(completions)
+    return [len(ids) for ids in completion_ids]
+
+def picky_reward_func(completions, **kwargs) -> list[float]:
+    if any(completion[0]["content"] == "poison" for completion in completions):
+        raise ValueError("poisoned batch")
+    return [1.0] * len(completions)
+
+def failing_reward_func(completions, **kwargs) -> list[float]:
+    raise ValueError("cannot score")
+
+FUNCS = [length_reward_func, word_reward_func]
+
+def completions_for(prefix, count):
+    return [[{"role": "assistant", "content": f"{prefix} sample {'word ' * index}"}] for index in range(count)]
+
+def test_load_reward_funcs():
+    assert load_reward_funcs(["test_reward_server:length_reward_func"]) == [length_reward_func]
+    with pytest.raises(ValueError):
+        load_reward_funcs(["test_reward_server.length_reward_func"])
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_batcher_coalesces_requests(workers):
+    batcher = RewardBatcher(FUNCS + [slow_reward_func], workers=workers, max_batch=1000, max_wait=0.2)
+    try:
+        requests = [completions_for(f"request {index}", index + 1) for index in range(8)]
+        futures = [batcher.submit(request) for request in requests]
+        results = [future.result(timeout=30) for future in futures]
+    finally:
+        batcher.close()
+    for request, result in zip(requests, results):
+        assert result == score_completions(FUNCS + [slow_reward_func], request)
+    assert batcher.requests == 8
+    assert batcher.batches < 8
+    assert batcher.completions == sum(len(request) for request in requests)
+
+def test_batcher_respects_max_batch():
+    batcher = RewardBatcher(FUNCS, max_batch=4, max_wait=0.2)
+    try:
+        futures = [batcher.submit(completions_for("x", 2)) for _ in range(6)]
+        for future in futures:
+            future.result(timeout=30)
+    finally:
+        batcher.close()
+    assert batcher.batches >= 3
+
+def test_server_and_client():
+    server = serve(FUNCS, workers=2, max_wait=0.05).start()
+    try:
+        client = RewardClient(server.url)
+        reward_funcs = client.reward_funcs()
+        assert [func.__name__ for func in reward_funcs] == ["length_reward_func", "word_reward_func"]
+
+        completions = completions_for("hello", 5)
+        assert [func(completions, prompts=None) for func in reward_funcs] == [
+            func(completions) for func in FUNCS
+        ]
+        assert client.health()["requests"] == 1  # both reward funcs share one request
+
+        def score(index):
+            request = completions_for(f"thread {index}", 3)
+            return request, RewardClient(server.url).score(request)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for request, scores in pool.map(score, range(16)):
+                assert scores == score_completions(FUNCS, request)
+        health = client.health()
+        assert health["requests"] == 17
+        assert health["batches"] < 17
+
+        assert client.score([]) == {"length_reward_func": [], "word_reward_func": []}
+        with pytest.raises(RuntimeError, match="400"):
+            client._request("/score", {"completions": "not a list"})
+    finally:
+        server.close()
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_completion_ids_are_forwarded(workers):
+    server = serve([ids_reward_func], workers=workers, max_wait=0.05).start()
+    try:
+        func = RewardClient(server.url).reward_funcs()[0]
+        completions = completions_for("x", 3)
+        assert func(completions, completion_ids=[[1], [1, 2], []]) == [1, 2, 0]
+        assert func(completions_for("y", 2)) == [-1, -1]
+        with pytest.raises(RuntimeError, match="400"):
+            RewardClient(server.url).score(completions, completion_ids=[[1]])
+    finally:
+        server.close()
+
+def test_reward_table_views_on_worker_pool():
+    from hemingway_rewards import RewardTable
+    from test_hemingway import COMPLEX_TEXT, SAMPLE_TEXT
+
+    table = RewardTable(lambda texts: [len(text) for text in texts])
+    completions = [[{"role": "assistant", "content": text}] for text in (SAMPLE_TEXT, COMPLEX_TEXT, "", "Short.")]
+    batcher = RewardBatcher(table.reward_funcs(), workers=2)
+    try:
+        scores = batcher.submit(completions).result(timeout=30)
+    finally:
+        batcher.close()
+    assert scores == score_completions(RewardTable(table.count_tokens).reward_funcs(), completions)
+
+def test_default_reward_funcs_on_spawned_workers(monkeypatch):
+    """Workers started without fork receive the default RewardTable views by pickling."""
+    import multiprocessing
+    import reward_server
+    from hemingway_rewards import score_text
+    from reward_server import DEFAULT_REWARD_FUNCS
+
+    monkeypatch.setattr(reward_server, "get_pool_context", lambda: multiprocessing.get_context("spawn"))
+    completions = completions_for("spawned", 3)
+    completion_ids = [[1] * (index + 1) for index in range(3)]
+    batcher = RewardBatcher(load_reward_funcs(DEFAULT_REWARD_FUNCS), workers=2)
+    try:
+        scores = batcher.submit(completions, completion_ids).result(timeout=60)
+    finally:
+        batcher.close()
+    rows = [score_text(completion[0]["content"], len(ids)) for completion, ids in zip(completions, completion_ids)]
+    assert list(scores.values()) == [list(column) for column in zip(*rows)]
+
+def test_server_reports_reward_errors():
+    server = serve([failing_reward_func]).start()
+    try:
+        with pytest.raises(RuntimeError, match="cannot score"):
+            RewardClient(server.url).score(completions_for("x", 1))
+    finally:
+        server.close()
+    assert not any(thread.name == "reward-batcher" for thread in threading.enumerate())
+
+def test_bad_requests_fail_alone():
+    batcher = RewardBatcher([picky_reward_func], max_batch=1000, max_wait=0.2)
+    try:
+        good = batcher.submit(completions_for("fine", 2))
+        bad = batcher.submit([[{"role": "assistant", "content": "poison"}]])
+        also_good = batcher.submit(completions_for("also fine", 1))
+        assert good.result(timeout=30) == {"picky_reward_func": [1.0, 1.0]}
+        assert also_good.result(timeout=30) == {"picky_reward_func": [1.0]}
+        with pytest.raises(ValueError, match="poisoned"):
+            bad.result(timeout=30)
+    finally:
+        batcher.close()
+    assert batcher.batches == 1
+
+    server = serve(FUNCS, max_wait=0.2).start()
+    try:
+        client = RewardClient(server.url)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            valid = pool.submit(client._request, "/score", {"completions": completions_for("ok", 2)})
+            malformed = pool.submit(client._request, "/score", {"completions": [{"content": "x"}]})
+            assert valid.result()["rewards"] == score_completions(FUNCS, completions_for("ok", 2))
+            with pytest.raises(RuntimeError, match="400"):
+                malformed.result()
+        for payload in ({"completions": [[]]}, {"completions": [[{"content": 1}]]},
+                        {"completions": ["text"], "completion_ids": [7]}):
+            with pytest.raises(RuntimeError, match="400"):
+                client._request("/score", payload)
+    finally:
+        server.close()
+
+def test_plain_string_completions_rejected():
+    """The default reward table reads message content, so bare strings get a 400, not a 500."""
+    from reward_server import DEFAULT_REWARD_FUNCS
+
+    server = serve(load_reward_funcs(DEFAULT_REWARD_FUNCS)).start()
+    try:
+        client = RewardClient(server.url)
+        with pytest.raises(RuntimeError, match="400"):
+            client._request("/score", {"completions": ["some text"]})
+        completions = completions_for("ok", 2)
+        rewards = client.score(completions, completion_ids=[[1, 2], [3]])
+        assert rewards["token_length_reward_func"] == [2 / 500, 1 / 500]
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,146 @@
+#!/opt/homebrew/bin/python3.12 -m pytest
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+from s1_generation import force_budget, generate_bucketed, plan_generation_buckets
+
+class FakeSamplingParams:
+    """The slice of vllm.SamplingParams the generation helpers use."""
+
+    def __init__(self, max_tokens, n=1, min_tokens=0):
+        self.max_tokens = max_tokens
+        self.n = n
+        self.min_tokens = min_tokens
+
+    def clone(self):
+        return copy.copy(self)
+
+class FakeLLM:
+    """In-process stand-in for vllm.LLM: records calls and echoes each prompt with its budget."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, prompts, sampling_params, **kwargs):
+        if not isinstance(sampling_params, list):
+            sampling_params = [sampling_params] * len(prompts)
+        budgets = [params.max_tokens for params in sampling_params]
+        self.calls.append((list(prompts), budgets, kwargs))
+        return list(zip(prompts, budgets))
+
+def test_plan_generation_buckets():
+    assert plan_generation_buckets([10, 90, 10, 95, 50], max_tokens=40, max_length=100) == {
+        40: [0, 2, 4],
+        10: [1],
+        5: [3],
+    }
+    assert plan_generation_buckets([], 40, 100) == {}
+    with pytest.raises(ValueError, match="Prompt too long"):
+        plan_generation_buckets([10, 100], 40, 100)
+
+def test_generate_bucketed_restores_order():
+    llm = FakeLLM()
+    prompts = ["short", "long prompt", "short too", "longest prompt", "medium"]
+    params = FakeSamplingParams(max_tokens=40, n=4)
+    outputs = generate_bucketed(llm.generate, prompts, params, [10, 90, 10, 95, 50], 100, use_tqdm=False)
+
+    assert outputs == [("short", 40), ("long prompt", 10), ("short too", 40), ("longest prompt", 5), ("medium", 40)]
+    assert llm.calls == [(prompts, [40, 10, 40, 5, 40], {"use_tqdm": False})]
+    assert params.max_tokens == 40  # the trainer's params are never modified
+
+def test_generate_bucketed_one_call_for_distinct_prompt_lengths():
+    # As in train_hemingway: max_tokens equals max_completion_length, so every prompt length is its own bucket
+    llm = FakeLLM()
+    lengths = [100 + index for index in range(32)]
+    prompts = [f"prompt {length}" for length in lengths]
+    outputs = generate_bucketed(llm.generate, prompts, FakeSamplingParams(1024, n=4), lengths, 1024)
+    assert len(llm.calls) == 1
+    assert outputs == [(prompt, 1024 - length) for prompt, length in zip(prompts, lengths)]
+    assert generate_bucketed(llm.generate, [], FakeSamplingParams(1024), [], 1024) == []
+    assert len(llm.calls) == 1
+
+def test_generate_bucketed_one_call_when_all_fit():
+    llm = FakeLLM()
+    prompts = [f"prompt {index}" for index in range(64)]
+    outputs = generate_bucketed(llm.generate, prompts, FakeSamplingParams(200), [20] * 64, 1024)
+    assert len(llm.calls) == 1
+    assert outputs == [(prompt, 200) for prompt in prompts]
+
+EOS = 0
+CUE = [99]
+
+def request_output(prompt_token_ids, *completions):
+    return SimpleNamespace(
+        prompt_token_ids=prompt_token_ids,
+        outputs=[
+            SimpleNamespace(token_ids=list(ids), finish_reason=reason, text=f"text of {ids}", logprobs=[{}] * len(ids),
+                            cumulative_logprob=-1.0)
+            for ids, reason in completions
+        ],
+    )
+
+class ScriptedGenerator:
+    """Stand-in generator that replays one scripted list of (token_ids, finish_reason) per call."""
+
+    def __init__(self, *rounds):
+        self.rounds = list(rounds)
+        self.calls = []
+
+    def generate(self, prompts, sampling_params, **kwargs):
+        self.calls.append((prompts, sampling_params, kwargs))
+        return [request_output(prompt["prompt_token_ids"], completion) for prompt, completion in
+                zip(prompts, self.rounds.pop(0))]
+
+def test_force_budget_resumes_early_stops():
+    outputs = [
+        request_output([1, 2], ([10, EOS], "stop"), (list(range(10, 20)), "length")),
+        request_output([3], ([20, EOS], "stop")),
+    ]
+    generator = ScriptedGenerator(
+        [([11, 12, EOS], "stop"), ([21, 22, 23, 24, 25, 26], "length")],
+        [([13, 14, EOS], "stop")],
+    )
+    rollouts = force_budget(
+        generator.generate, outputs, FakeSamplingParams(max_tokens=10, n=2, min_tokens=6),
+        CUE, min_tokens=6, num_ignore=2, max_length=100, stop_token_ids=[EOS],
+        decode=lambda ids: " ".join(map(str, ids)), use_tqdm=False,
+    )
+
+    first_round, second_round = generator.calls
+    assert first_round[0] == [{"prompt_token_ids": [1, 2, 10, 99]}, {"prompt_token_ids": [3, 20, 99]}]
+    assert [(params.n, params.max_tokens, params.min_tokens) for params in first_round[1]] == [(1, 8, 0), (1, 8, 0)]
+    assert first_round[2] == {"use_tqdm": False}
+    assert second_round[0] == [{"prompt_token_ids": [1, 2, 10, 99, 11, 12, 99]}]
+    assert second_round[1][0].max_tokens == 5
+
+    forced, untouched = outputs[0].outputs
+    assert forced.token_ids == [10, 99, 11, 12, 99, 13, 14, EOS] and forced.finish_reason == "stop"
+    assert untouched.token_ids == list(range(10, 20)) and untouched.finish_reason == "length"
+    # Forced completions get text for their final ids and lose the first segment's logprobs
+    assert forced.text == "10 99 11 12 99 13 14 0"
+    assert forced.logprobs is None and forced.cumulative_logprob is None
+    assert untouched.text == f"text of {list(range(10, 20))}" and untouched.cumulative_logprob == -1.0
+    assert outputs[1].outputs[0].token_ids == [20, 99, 21, 22, 23, 24, 25, 26]
+    assert outputs[1].outputs[0].finish_reason == "length"
+    assert [(rollout.rounds, rollout.remaining) for rollout in rollouts] == [(2, 2), (0, 0), (1, 2)]
+
+def test_force_budget_respects_budget_and_rounds():
+    # The prompt leaves 4 tokens: after [5, 6, 7] there is no room for the cue and one more token
+    outputs = [request_output([1] * 96, ([5, 6, 7, EOS], "stop")), request_output([2], ([7, EOS], "stop"))]
+    generator = ScriptedGenerator([([8, EOS], "stop")])
+    rollouts = force_budget(generator.generate, outputs, FakeSamplingParams(50), CUE, 20, 1, 100, [EOS])
+    assert len(generator.calls) == 1  # num_ignore=1: a single round
+    assert generator.calls[0][0] == [{"prompt_token_ids": [2, 7, 99]}]
+    assert outputs[0].outputs[0].token_ids == [5, 6, 7, EOS]
+    assert outputs[1].outputs[0].token_ids == [7, 99, 8, EOS]
+    assert outputs[1].outputs[0].text is None  # no decoder: the stale text is cleared
+    assert [rollout.rounds for rollout in rollouts] == [0, 1]
+
+    untouched = [request_output([1], ([5, EOS], "stop"))]
+    force_budget(ScriptedGenerator().generate, untouched, FakeSamplingParams(50), CUE, 20, 0, 100, [EOS])
+    assert untouched[0].outputs[0].token_ids == [5, EOS]
+
+if __name__ == "__main__":
+    pytest.main([__file__])